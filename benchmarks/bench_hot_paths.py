@@ -0,0 +1,226 @@
+"""Benchmark the sensor and calendar hot paths of Date Countdown.
+
+Run from the repository root, no network or Home Assistant install needed:
+
+    python benchmarks/bench_hot_paths.py
+    python benchmarks/bench_hot_paths.py --sizes 10 1000 --calendar-sample 200
+
+For each synthetic payload size it reports the wall time, the throughput and
+the peak traced memory of:
+
+* ``sensor.async_setup_entry`` (coordinator creation, parsing and entities)
+  and ``calendar.async_setup_entry``;
+* the deferred first computation of the entry, pushed to every sensor;
+* a full update round of every ``DateCountdownSensor`` (coordinator refresh
+  and coordinator push to the sensors);
+* the computation of all states one by one and with the NumPy batch engine,
+  when NumPy is installed;
+* the longest event loop stall of a refresh computed inline and of one
+  offloaded in shards to the executor;
+* ``DateCountdownCalendar.event`` for every calendar;
+* ``DateCountdownCalendar.async_get_events`` over 1, 10 and 50 year windows,
+  on a sample of calendars and with cold caches, then over 50 years again
+  with the occurrence summaries already cached.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import stubs  # noqa: E402
+
+const = stubs.load("const")
+coordinator_module = stubs.load("coordinator")
+batch = stubs.load("batch")
+sensor = stubs.load("sensor")
+calendar = stubs.load("calendar")
+dt_util = sys.modules["homeassistant.util.dt"]
+
+# NumPy est importé avant les mesures : son coût est celui de bench_import_time.py
+batch.numpy_available()
+
+DEFAULT_SIZES = [10, 1_000, 100_000]
+WINDOW_YEARS = [1, 10, 50]
+
+
+def build_events(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build a synthetic options payload covering every event type."""
+    rng = random.Random(seed)
+    events = []
+    for index in range(count):
+        event_type = const.EVENT_TYPES[index % len(const.EVENT_TYPES)]
+        # Un événement sur cinquante tombe un 29 février
+        if index % 50 == 0:
+            origin = date(rng.choice([1948, 1964, 1980, 1996]), 2, 29)
+        else:
+            origin = date(1930, 1, 1) + timedelta(days=rng.randrange(0, 34_000))
+        event = {"name": f"Nom {index}", "first_name": f"Prénom {index}", "type": event_type}
+        if event_type == "retirement":
+            event["start_date"] = origin.strftime("%d/%m/%Y")
+            event["is_penible"] = index % 3 == 0
+            event["career_type"] = "longue" if index % 4 == 0 else "normale"
+        else:
+            event["date"] = origin.strftime("%d/%m/%Y")
+        if event_type == "memorial" and index % 2 == 0:
+            event["death_date"] = (origin + timedelta(days=rng.randrange(365, 36_000))).strftime("%d/%m/%Y")
+        events.append(event)
+    return events
+
+
+def measure(func: Callable[[], Awaitable[Any]]) -> Tuple[float, int, Any]:
+    """Run a coroutine function, returning its duration, peak memory and result."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    result = asyncio.run(func())
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+async def loop_stall(func: Callable[[], Awaitable[Any]]) -> Tuple[float, float]:
+    """Run a coroutine function, returning its duration and the longest event loop stall meanwhile."""
+    done = False
+    stall = 0.0
+
+    async def heartbeat() -> None:
+        nonlocal stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await func()
+    elapsed = time.perf_counter() - started
+    done = True
+    await task
+    return elapsed, stall
+
+
+def report(label: str, operations: int, elapsed: float, peak: int) -> None:
+    """Print one benchmark line."""
+    throughput = operations / elapsed if elapsed else float("inf")
+    print(f"  {label:<34} {elapsed * 1000:>10.1f} ms {throughput:>14,.0f} ops/s {peak / 1024 / 1024:>9.2f} MiB")
+
+
+def run_size(size: int, calendar_sample: int) -> None:
+    """Run every benchmark for one payload size."""
+    print(f"\n{size:,} events")
+    hass = stubs.FakeHass()
+    entry = stubs.FakeConfigEntry("bench", {"events": build_events(size)})
+    sensors: List[Any] = []
+    calendars: List[Any] = []
+
+    async def setup() -> None:
+        coordinator = coordinator_module.DateCountdownCoordinator(hass, entry, entry.options["events"])
+        hass.data.setdefault(const.DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+        await sensor.async_setup_entry(hass, entry, sensors.extend)
+
+    elapsed, peak, _ = measure(setup)
+    report("sensor.async_setup_entry", size, elapsed, peak)
+    coordinator = hass.data[const.DOMAIN][entry.entry_id]["coordinator"]
+    for entity in sensors:
+        coordinator.async_add_listener(entity._handle_coordinator_update)
+
+    async def first_refresh() -> None:
+        await coordinator.async_refresh()
+
+    elapsed, peak, _ = measure(first_refresh)
+    report("first computation", len(sensors), elapsed, peak)
+
+    async def update_round() -> None:
+        await coordinator.async_refresh()
+
+    elapsed, peak, _ = measure(update_round)
+    report("sensor update round", len(sensors), elapsed, peak)
+
+    today = dt_util.now().date()
+
+    async def compute_loop() -> None:
+        for event in coordinator.events:
+            coordinator_module.compute_event_state(event, today)
+
+    elapsed, peak, _ = measure(compute_loop)
+    report("compute_event_state (loop)", len(coordinator.events), elapsed, peak)
+
+    if batch.numpy_available():
+        engine = batch.BatchEngine(coordinator.events)
+
+        async def compute_batch() -> None:
+            engine.compute(today)
+
+        elapsed, peak, _ = measure(compute_batch)
+        report("BatchEngine.compute", len(coordinator.events), elapsed, peak)
+
+    for offloaded in (False, True):
+        coordinator.offload_threshold = 0 if offloaded else len(coordinator.events) + 1
+        coordinator.shards = coordinator_module.build_shards(coordinator.events, coordinator._shard_size)
+        asyncio.run(coordinator.async_prepare_batch_engine())
+        elapsed, stall = asyncio.run(loop_stall(coordinator.async_refresh))
+        mode = f"offloaded, {len(coordinator.shards)} shard(s)" if offloaded else "inline"
+        print(f"  {'refresh ' + mode:<34} {elapsed * 1000:>10.1f} ms   longest loop stall {stall * 1000:>8.1f} ms")
+
+    async def setup_calendars() -> None:
+        await calendar.async_setup_entry(hass, entry, calendars.extend)
+
+    elapsed, peak, _ = measure(setup_calendars)
+    report("calendar.async_setup_entry", size, elapsed, peak)
+
+    async def next_events() -> int:
+        return sum(1 for entity in calendars if entity.event is not None)
+
+    elapsed, peak, _ = measure(next_events)
+    report("DateCountdownCalendar.event", len(calendars), elapsed, peak)
+
+    sample = calendars[:calendar_sample]
+    start = dt_util.start_of_local_day(dt_util.now())
+    # La dernière fenêtre est rejouée avec les résumés déjà en cache, seul le cache des fenêtres étant vidé
+    for years, cold in [*((years, True) for years in WINDOW_YEARS), (WINDOW_YEARS[-1], False)]:
+        end = start + timedelta(days=365 * years)
+        for entity in sample:
+            entity._events_cache = None
+            if cold:
+                entity._summaries._cache.clear()
+
+        async def get_events() -> int:
+            total = 0
+            for entity in sample:
+                total += len(await entity.async_get_events(hass, start, end))
+            return total
+
+        elapsed, peak, occurrences = measure(get_events)
+        label = f"async_get_events {years:>2}y ({len(sample)} cal.)" if cold else "  again, summaries cached"
+        report(label, len(sample), elapsed, peak)
+        report(f"  -> {occurrences:,} occurrences", occurrences, elapsed, peak)
+
+
+def main() -> None:
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="number of events per payload")
+    parser.add_argument(
+        "--calendar-sample", type=int, default=1_000, help="calendars queried by the async_get_events benchmarks"
+    )
+    args = parser.parse_args()
+
+    print(f"Date Countdown benchmarks - {datetime.now():%Y-%m-%d %H:%M}, Python {sys.version.split()[0]}")
+    print(f"  {'benchmark':<34} {'time':>13} {'throughput':>20} {'peak mem':>13}")
+    for size in args.sizes:
+        run_size(size, args.calendar_sample)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark what importing Date Countdown costs at Home Assistant startup.
+
+Run from the repository root, no network or Home Assistant install needed:
+
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --modules coordinator sensor --top 10
+
+Each module is imported in a fresh interpreter with ``python -X importtime``,
+after the Home Assistant stand-ins, so only the modules of the integration
+and the third-party modules they pull in are measured. For each module it
+reports the cumulative import time, then the modules that cost the most on
+their own. ``__init__`` is what Home Assistant imports to set up an entry,
+with the services and the iCalendar view, and ``config_flow`` what it imports
+to show the configuration forms. Modules loaded on first use, such as
+``labels`` and NumPy, do not appear until something calls them.
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import stubs  # noqa: E402
+
+DEFAULT_MODULES = ["__init__", "config_flow", "const", "coordinator", "sensor", "calendar"]
+DEFAULT_REPEAT = 5
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+_SCRIPT = """
+import sys
+sys.path.insert(0, {path!r})
+import stubs
+stubs.install_package()
+import {package}.{module}
+"""
+
+
+def import_times(module: str) -> List[Tuple[str, int, int]]:
+    """Import a module in a new interpreter and return (name, self us, cumulative us) per imported module."""
+    script = _SCRIPT.format(path=str(Path(__file__).resolve().parent), package=stubs.PACKAGE_NAME, module=module)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script], capture_output=True, text=True, check=True
+    )
+    times = []
+    # Seuls les imports qui suivent les stand-ins sont comptés
+    started = False
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        name = match.group(4)
+        if name == "stubs":
+            started = True
+            continue
+        if started:
+            times.append((name, int(match.group(1)), int(match.group(2))))
+    return times
+
+
+def run_module(module: str, repeat: int, top: int) -> None:
+    """Measure one module, keeping the fastest of ``repeat`` runs."""
+    target = f"{stubs.PACKAGE_NAME}.{module}"
+    runs = [import_times(module) for _ in range(repeat)]
+    best = min(runs, key=lambda times: next((cumulative for name, _, cumulative in times if name == target), 0))
+    total = next((cumulative for name, _, cumulative in best if name == target), 0)
+    print(f"\n{module}")
+    print(f"  {'cumulative':<34} {total / 1000:>10.1f} ms")
+    for name, self_time, _ in sorted(best, key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {name:<34} {self_time / 1000:>10.1f} ms")
+
+
+def main() -> None:
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES, help="modules of the integration to import")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per module, the fastest is kept")
+    parser.add_argument("--top", type=int, default=5, help="most expensive modules listed per module")
+    args = parser.parse_args()
+
+    print(f"Date Countdown import times - Python {sys.version.split()[0]}")
+    print(f"  {'module':<34} {'self':>13}")
+    for module in args.modules:
+        run_module(module, args.repeat, args.top)
+
+
+if __name__ == "__main__":
+    main()
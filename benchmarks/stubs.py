@@ -0,0 +1,236 @@
+"""Lightweight Home Assistant stand-ins for the Date Countdown benchmarks.
+
+Only the names imported by the modules of the integration are provided,
+with just enough behaviour to run the sensor, calendar and coordinator hot
+paths without Home Assistant installed. The config flow, services and HTTP
+view only need to import: voluptuous, aiohttp and the names they use are
+inert placeholders, loaded by Home Assistant before any integration anyway.
+The integration package is then loaded under the name ``date_countdown``
+without running its ``__init__`` module.
+"""
+import asyncio
+import importlib
+import sys
+import types
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+from zoneinfo import ZoneInfo
+
+PACKAGE_NAME = "date_countdown"
+PACKAGE_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "date-countdown"
+
+_T = TypeVar("_T")
+
+
+class FakeHass:
+    """Stand-in for HomeAssistant holding only ``hass.data``."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+        self.bus = types.SimpleNamespace(async_listen=lambda *args, **kwargs: (lambda: None))
+
+    async def async_add_executor_job(self, target: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+    async def async_add_import_executor_job(self, target: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+class FakeConfigEntry:
+    """Stand-in for a config entry."""
+
+    def __init__(self, entry_id: str, options: Dict[str, Any], title: str = "Benchmark") -> None:
+        self.entry_id = entry_id
+        self.options = options
+        self.data: Dict[str, Any] = {}
+        self.title = title
+        self._on_unload: List[Callable[[], None]] = []
+
+    def async_on_unload(self, func: Callable[[], None]) -> None:
+        self._on_unload.append(func)
+
+
+def _callback(func: Callable) -> Callable:
+    return func
+
+
+class _Placeholder:
+    """Any attribute, call or subscript of it is another placeholder, usable as a dict key."""
+
+    def __getattr__(self, name: str) -> "_Placeholder":
+        return _Placeholder()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "_Placeholder":
+        return _Placeholder()
+
+    def __getitem__(self, key: Any) -> "_Placeholder":
+        return _Placeholder()
+
+
+class _PlaceholderModule(types.ModuleType):
+    def __getattr__(self, name: str) -> _Placeholder:
+        return _Placeholder()
+
+
+class _ConfigFlow:
+    def __init_subclass__(cls, domain: Optional[str] = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+
+class _Entity:
+    _attr_unique_id: Optional[str] = None
+    _attr_name: Optional[str] = None
+    _attr_icon: Optional[str] = None
+
+    @property
+    def unique_id(self) -> Optional[str]:
+        return self._attr_unique_id
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._attr_name
+
+    def async_write_ha_state(self) -> None:
+        """State writes are not part of the measured work."""
+
+
+class _DataUpdateCoordinator(Generic[_T]):
+    def __init__(self, hass: Any, logger: Any, *, name: str, update_interval: Optional[timedelta] = None, **kwargs: Any) -> None:
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.update_interval = update_interval
+        self.data: Optional[_T] = None
+        self.last_update_success = True
+        self._listeners: List[Callable[[], None]] = []
+
+    async def _async_update_data(self) -> _T:
+        raise NotImplementedError
+
+    async def async_refresh(self) -> None:
+        self.data = await self._async_update_data()
+        self.async_update_listeners()
+
+    def async_set_updated_data(self, data: _T) -> None:
+        self.data = data
+        self.async_update_listeners()
+
+    def async_update_listeners(self) -> None:
+        for listener in list(self._listeners):
+            listener()
+
+    async def async_config_entry_first_refresh(self) -> None:
+        await self.async_refresh()
+
+    def async_add_listener(self, update_callback: Callable[[], None], context: Any = None) -> Callable[[], None]:
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+
+class _CoordinatorEntity(_Entity, Generic[_T]):
+    def __init__(self, coordinator: _T, context: Any = None) -> None:
+        self.coordinator = coordinator
+
+    def _handle_coordinator_update(self) -> None:
+        self.async_write_ha_state()
+
+
+@dataclass
+class _CalendarEvent:
+    start: datetime
+    end: datetime
+    summary: str
+    description: Optional[str] = None
+    location: Optional[str] = None
+    uid: Optional[str] = None
+
+
+class _DtUtil(types.ModuleType):
+    """Subset of homeassistant.util.dt."""
+
+    DEFAULT_TIME_ZONE = ZoneInfo("Europe/Paris")
+    UTC = ZoneInfo("UTC")
+
+    def now(self, time_zone: Any = None) -> datetime:
+        return datetime.now(time_zone or self.DEFAULT_TIME_ZONE)
+
+    def utcnow(self) -> datetime:
+        return datetime.now(self.UTC)
+
+    def as_local(self, dattim: datetime) -> datetime:
+        return dattim.astimezone(self.DEFAULT_TIME_ZONE)
+
+    def as_utc(self, dattim: datetime) -> datetime:
+        return dattim.astimezone(self.UTC)
+
+    def start_of_local_day(self, dt_or_d: Any = None) -> datetime:
+        day = dt_or_d.date() if isinstance(dt_or_d, datetime) else (dt_or_d or self.now().date())
+        return datetime.combine(day, time(), tzinfo=self.DEFAULT_TIME_ZONE)
+
+
+def _module(name: str, **attrs: Any) -> types.ModuleType:
+    module = types.ModuleType(name)
+    for key, value in attrs.items():
+        setattr(module, key, value)
+    sys.modules[name] = module
+    return module
+
+
+def install() -> None:
+    """Register the stand-in modules in place of Home Assistant."""
+    if getattr(sys.modules.get("homeassistant"), "__benchmark_stub__", False):
+        return
+
+    dt_util = _DtUtil("homeassistant.util.dt")
+    sys.modules["homeassistant.util.dt"] = dt_util
+    _module("homeassistant", __benchmark_stub__=True)
+    _module("homeassistant.util", dt=dt_util)
+    _module("homeassistant.components")
+    _module("homeassistant.components.sensor", SensorEntity=_Entity)
+    _module("homeassistant.components.calendar", CalendarEntity=_Entity, CalendarEvent=_CalendarEvent)
+    _module("homeassistant.components.http", HomeAssistantView=object)
+    _module("homeassistant.config_entries", ConfigEntry=FakeConfigEntry, ConfigFlow=_ConfigFlow, OptionsFlow=object)
+    _module("homeassistant.const", EVENT_CORE_CONFIG_UPDATE="core_config_updated")
+    _module(
+        "homeassistant.core",
+        HomeAssistant=FakeHass,
+        Event=object,
+        ServiceCall=object,
+        ServiceResponse=Any,
+        SupportsResponse=_Placeholder(),
+        callback=_callback,
+    )
+    _module("homeassistant.data_entry_flow", FlowResult=Dict[str, Any])
+    _module("homeassistant.exceptions", HomeAssistantError=Exception)
+    _module("homeassistant.helpers", entity_registry=types.SimpleNamespace(async_get=lambda hass: None))
+    sys.modules["homeassistant.helpers.config_validation"] = _PlaceholderModule("homeassistant.helpers.config_validation")
+    _module("homeassistant.helpers.dispatcher", async_dispatcher_connect=lambda hass, signal, target: (lambda: None), async_dispatcher_send=lambda hass, signal, *args: None)
+    _module("homeassistant.helpers.entity", Entity=_Entity, EntityCategory=types.SimpleNamespace(DIAGNOSTIC="diagnostic"))
+    _module("homeassistant.helpers.event", async_track_point_in_utc_time=lambda hass, action, point: (lambda: None))
+    _module("homeassistant.helpers.service", async_register_admin_service=lambda hass, domain, service, func, schema=None: None)
+    _module("homeassistant.helpers.start", async_at_started=lambda hass, at_start_cb: (lambda: None))
+    _module("homeassistant.helpers.storage", Store=object)
+    _module(
+        "homeassistant.helpers.update_coordinator",
+        DataUpdateCoordinator=_DataUpdateCoordinator,
+        CoordinatorEntity=_CoordinatorEntity,
+    )
+    for name in ("voluptuous", "aiohttp", "aiohttp.web"):
+        sys.modules[name] = _PlaceholderModule(name)
+
+
+def install_package() -> None:
+    """Register the integration package, without running its ``__init__`` module."""
+    install()
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [str(PACKAGE_PATH)]
+        sys.modules[PACKAGE_NAME] = package
+
+
+def load(module: str) -> types.ModuleType:
+    """Import a module of the integration through the stand-ins."""
+    install_package()
+    return importlib.import_module(f"{PACKAGE_NAME}.{module}")
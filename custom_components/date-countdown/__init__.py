@@ -1,25 +1,70 @@
 """Custom component for Date Countdown in Home Assistant."""
+import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, PLATFORMS
+from .coordinator import DateCountdownCoordinator
+from .export import DateCountdownIcsView
+from .services import async_setup_services
+from .storage import async_get_event_store, async_remove_event_store
+
+_LOGGER = logging.getLogger(__name__)
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Date Countdown component."""
+    await async_setup_services(hass)
+    hass.http.register_view(DateCountdownIcsView(hass))
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Date Countdown from a config entry."""
+    """Set up Date Countdown from a config entry.
+
+    The events are parsed once and shared by both platforms. The entities are
+    added before any state is computed: the first computation of the entry
+    runs in a single pass once Home Assistant has started.
+    """
+    started = time.perf_counter()
     hass.data.setdefault(DOMAIN, {})
+    store = await async_get_event_store(hass, entry)
+    if "events" in entry.options:
+        # Les événements sont désormais dans le stockage dédié
+        hass.config_entries.async_update_entry(
+            entry, options={key: value for key, value in entry.options.items() if key != "events"}
+        )
+    coordinator = DateCountdownCoordinator(hass, entry, store.events)
+    await coordinator.async_prepare_batch_engine()
+    hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator, "store": store, "options": dict(entry.options)}
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    coordinator.async_start()
     entry.async_on_unload(entry.add_update_listener(async_update_entry))
+    coordinator.stats.setup_duration = time.perf_counter() - started
+    _LOGGER.info(
+        "Entry %s set up with %d event(s) in %.1f ms",
+        entry.entry_id, len(coordinator.events), coordinator.stats.setup_duration * 1000,
+    )
     return True
 
 async def async_update_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle config entry updates."""
+    """Handle config entry updates.
+
+    Event edits are applied in place by the coordinator, so the entry is only
+    reloaded when its settings change, not when only its title does.
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is not None and entry_data["options"] == dict(entry.options):
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+    return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored events of a removed config entry."""
+    await async_remove_event_store(hass, entry.entry_id)
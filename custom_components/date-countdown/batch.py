@@ -0,0 +1,295 @@
+"""Vectorized computation of the states of all events of an entry.
+
+The engine needs NumPy, which Home Assistant ships with. It takes tens of
+milliseconds to import, so it is not imported with this module: the
+coordinator calls ``numpy_available`` in the import executor once an entry
+is large enough. Until then, or when NumPy is missing, ``create_batch_engine``
+returns ``None`` and the coordinator keeps computing the events one by one
+with ``compute_event_state``.
+"""
+from calendar import isleap
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .const import EVENT_TYPES, LEAP_DAY_MARCH_1, LEAP_DAY_POLICY
+from .lookup import WORK_MEDAL_PENIBLE_TABLE, WORK_MEDAL_TABLE, get_age_category, get_wedding_type
+from .model import CountdownEvent
+
+# Module NumPy, importé par numpy_available()
+np: Any = None
+_numpy_missing = False
+
+# Ordinal du 1er janvier 1970, origine des datetime64
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Ordinal retenu pour une date absente
+NO_DATE = 0
+
+
+def numpy_available() -> bool:
+    """Import NumPy on first call and return whether it is installed.
+
+    Blocks while importing: call it from an executor, not the event loop.
+    """
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - dépend de l'installation
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np is not None
+
+
+def numpy_loaded() -> bool:
+    """Return whether NumPy has already been imported, without importing it."""
+    return np is not None
+
+
+def _ordinals(dates: Sequence[Optional[date]]) -> "np.ndarray":
+    """Convert dates to an array of ordinals, NO_DATE for a missing date."""
+    return np.array([NO_DATE if day is None else day.toordinal() for day in dates], dtype=np.int64)
+
+
+def _days(ordinals: "np.ndarray") -> "np.ndarray":
+    """Convert date ordinals to a ``datetime64[D]`` array."""
+    return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def _year_month_day(days: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Split ``datetime64[D]`` dates into year, month and day arrays."""
+    months = days.astype("datetime64[M]")
+    year = days.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+    return year, month, day
+
+
+def _completed_years(year: Any, month_day: Any, origin_year: Any, origin_month_day: Any) -> Any:
+    """Return the whole years elapsed since the origins, on a date given as (year, month * 100 + day)."""
+    return year - origin_year - (month_day < origin_month_day)
+
+
+def _years_between(dates: "np.ndarray", origin_year: "np.ndarray") -> "np.ndarray":
+    """Return the difference between the years of ``datetime64[D]`` dates and origin years."""
+    return dates.astype("datetime64[Y]").astype(np.int64) + 1970 - origin_year
+
+
+class _Group:
+    """Origin dates of some events of an engine, as parallel arrays."""
+
+    def __init__(self, ids: List[str], rows: "np.ndarray", origins: "np.ndarray") -> None:
+        """Build the arrays of the events at the given positions."""
+        self.ids = [ids[row] for row in rows.tolist()]
+        self.year, self.month, self.day = _year_month_day(_days(origins[rows]))
+        self.month_day = self.month * 100 + self.day
+        self.leap_day = self.month_day == 229
+
+
+class BatchEngine:
+    """Dates of the events of an entry as ``datetime64[D]`` and integer arrays.
+
+    The arrays are built from the date ordinals of the events, grouped by
+    event type, once per event list. Computing a day then takes a few array
+    operations per group and a single pass to build the state dicts, without
+    the per-event branches and date objects of ``compute_event_state``, whose
+    results it reproduces exactly.
+    """
+
+    def __init__(self, events: Sequence[CountdownEvent], policy: str = LEAP_DAY_POLICY) -> None:
+        """Group the events by type and build their arrays."""
+        numpy_available()
+        self._policy = policy
+        type_indexes = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+        origins = _ordinals([event.event_date for event in events])
+        deaths = _ordinals([event.death_date for event in events])
+        retirements = _ordinals([event.retirement_date for event in events])
+        type_codes = np.array([type_indexes[event.event_type] for event in events], dtype=np.int64)
+        penible = np.array([event.is_penible for event in events], dtype=bool)
+        ids = [event.unique_id for event in events]
+        self._count = len(ids)
+
+        def _rows(mask: "np.ndarray") -> "np.ndarray":
+            return np.flatnonzero(mask)
+
+        def _group(rows: "np.ndarray") -> _Group:
+            return _Group(ids, rows, origins)
+
+        retirement_code = EVENT_TYPES.index("retirement")
+        memorial_code = EVENT_TYPES.index("memorial")
+        self._yearly = {
+            EVENT_TYPES[code]: _group(_rows(type_codes == code))
+            for code in np.unique(type_codes).tolist()
+            if code not in (retirement_code, memorial_code)
+        }
+
+        memorials = _rows(type_codes == memorial_code)
+        self._memorials = _group(memorials)
+        memorial_deaths = deaths[memorials]
+        self._has_death = (memorial_deaths != NO_DATE).tolist()
+        death_dates = _days(np.where(memorial_deaths != NO_DATE, memorial_deaths, origins[memorials]))
+        self._death_year, death_month, death_day = _year_month_day(death_dates)
+        self._death_month_day = death_month * 100 + death_day
+
+        # Une retraite sans date calculable n'a que ses années travaillées
+        is_retirement = type_codes == retirement_code
+        self._undated = _group(_rows(is_retirement & (retirements == NO_DATE)))
+        dated = _rows(is_retirement & (retirements != NO_DATE))
+        self._retirements = _group(dated)
+        self._retirement = _days(retirements[dated])
+        self._retirement_dates = self._retirement.tolist()
+        self._retirement_year, retirement_month, retirement_day = _year_month_day(self._retirement)
+        self._retirement_month_day = retirement_month * 100 + retirement_day
+        self._penible = penible[dated]
+        self._medal_labels = [
+            WORK_MEDAL_PENIBLE_TABLE.labels if penible else WORK_MEDAL_TABLE.labels
+            for penible in self._penible.tolist()
+        ]
+        self._medal_thresholds = np.array(WORK_MEDAL_TABLE.thresholds, dtype=np.int64)
+        self._penible_thresholds = np.array(WORK_MEDAL_PENIBLE_TABLE.thresholds, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return self._count
+
+    def _next_occurrences(self, group: _Group, today: date, today64: "np.datetime64") -> "np.ndarray":
+        """Return the first anniversary of every event of a group on or after today."""
+
+        def _in_year(year: int) -> "np.ndarray":
+            months = np.datetime64(f"{year:04d}-01", "M") + (group.month - 1)
+            # Un 29 février déborde sur le 1er mars les années communes
+            occurrences = months.astype("datetime64[D]") + (group.day - 1)
+            if self._policy != LEAP_DAY_MARCH_1 and not isleap(year):
+                occurrences = np.where(group.leap_day, occurrences - 1, occurrences)
+            return occurrences
+
+        occurrences = _in_year(today.year)
+        return np.where(occurrences < today64, _in_year(today.year + 1), occurrences)
+
+    def compute(self, today: date) -> Dict[str, Dict[str, Any]]:
+        """Compute the state of every event for the given day."""
+        today64 = np.datetime64(today, "D")
+        today_month_day = today.month * 100 + today.day
+        data: Dict[str, Dict[str, Any]] = {}
+
+        for event_type, group in self._yearly.items():
+            next_dates = self._next_occurrences(group, today, today64)
+            years = _years_between(next_dates, group.year).tolist()
+            if event_type == "anniversary":
+                extras = [(get_wedding_type(count), None, None) for count in years]
+            elif event_type == "birthday":
+                extras = []
+                for count in years:
+                    category, icon = get_age_category(count)
+                    extras.append((None, category, icon) if category else (None, None, None))
+            else:
+                extras = [(None, None, None)] * len(years)
+            columns = zip(group.ids, next_dates.tolist(), (next_dates - today64).astype(np.int64).tolist(), years, extras)
+            for unique_id, next_date, state, count, (wedding_type, category, icon) in columns:
+                data[unique_id] = {
+                    "state": state,
+                    "years": count,
+                    "wedding_type": wedding_type,
+                    "age_if_alive": None,
+                    "years_since_death": None,
+                    "age_category": category,
+                    "icon": icon,
+                    "years_remaining": None,
+                    "years_retired": None,
+                    "work_medal": None,
+                    "age_at_death": None,
+                    "next_date": next_date,
+                }
+
+        group = self._memorials
+        next_dates = self._next_occurrences(group, today, today64)
+        columns = zip(
+            group.ids,
+            next_dates.tolist(),
+            (next_dates - today64).astype(np.int64).tolist(),
+            _years_between(next_dates, group.year).tolist(),
+            _completed_years(today.year, today_month_day, group.year, group.month_day).tolist(),
+            self._has_death,
+            _completed_years(today.year, today_month_day, self._death_year, self._death_month_day).tolist(),
+            _completed_years(self._death_year, self._death_month_day, group.year, group.month_day).tolist(),
+        )
+        for unique_id, next_date, state, count, age_if_alive, has_death, since_death, age_at_death in columns:
+            data[unique_id] = {
+                "state": state,
+                "years": count,
+                "wedding_type": None,
+                "age_if_alive": age_if_alive,
+                "years_since_death": since_death if has_death else None,
+                "age_category": None,
+                "icon": None,
+                "years_remaining": None,
+                "years_retired": None,
+                "work_medal": None,
+                "age_at_death": age_at_death if has_death else None,
+                "next_date": next_date,
+            }
+
+        group = self._undated
+        worked = _completed_years(today.year, today_month_day, group.year, group.month_day).tolist()
+        for unique_id, count in zip(group.ids, worked):
+            data[unique_id] = {
+                "state": None,
+                "years": count,
+                "wedding_type": None,
+                "age_if_alive": None,
+                "years_since_death": None,
+                "age_category": None,
+                "icon": None,
+                "years_remaining": None,
+                "years_retired": None,
+                "work_medal": None,
+                "age_at_death": None,
+                "next_date": None,
+            }
+
+        group = self._retirements
+        worked = _completed_years(today.year, today_month_day, group.year, group.month_day)
+        retired = self._retirement <= today64
+        medals = np.where(
+            self._penible,
+            np.searchsorted(self._penible_thresholds, worked, side="right"),
+            np.searchsorted(self._medal_thresholds, worked, side="right"),
+        )
+        columns = zip(
+            group.ids,
+            self._retirement_dates,
+            worked.tolist(),
+            retired.tolist(),
+            np.where(retired, 0, (self._retirement - today64).astype(np.int64)).tolist(),
+            _completed_years(today.year, today_month_day, self._retirement_year, self._retirement_month_day).tolist(),
+            (self._retirement_year - today.year - (today_month_day > self._retirement_month_day)).tolist(),
+            medals.tolist(),
+            self._medal_labels,
+        )
+        for unique_id, retirement_date, count, is_retired, state, years_retired, years_remaining, medal, labels in columns:
+            data[unique_id] = {
+                "state": state,
+                "years": count,
+                "wedding_type": None,
+                "age_if_alive": None,
+                "years_since_death": None,
+                "age_category": None,
+                "icon": None,
+                "years_remaining": 0 if is_retired else years_remaining,
+                "years_retired": years_retired if is_retired else None,
+                "work_medal": labels[medal - 1] if medal else None,
+                "age_at_death": None,
+                "next_date": retirement_date,
+            }
+        return data
+
+
+def create_batch_engine(events: Sequence[CountdownEvent], min_events: int) -> Optional[BatchEngine]:
+    """Return a batch engine for large event lists, or None to compute events one by one.
+
+    Never imports NumPy: returns None until ``numpy_available`` has loaded it.
+    """
+    if len(events) < min_events or not numpy_loaded():
+        return None
+    return BatchEngine(events)
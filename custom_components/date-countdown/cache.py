@@ -0,0 +1,40 @@
+"""Small in-memory caches for Date Countdown."""
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+
+class LRUCache(Generic[_T]):
+    """A bounded mapping that evicts the least recently used entry."""
+
+    __slots__ = ("_maxsize", "_data")
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, _T]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[_T]:
+        """Return a cached value and mark it as recently used."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: _T) -> None:
+        """Store a value, evicting the oldest entry when the cache is full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._data.clear()
@@ -1,252 +1,353 @@
 """Calendar platform for Date Countdown."""
 import logging
-from datetime import date, datetime, timedelta, time, timezone
-from typing import Optional, Callable, List
+from datetime import date, datetime, timedelta, time
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, Optional, Callable, List, Tuple
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
+from .cache import LRUCache
 from .const import (
+    CALENDAR_CACHE_SIZE,
+    CALENDAR_MAX_YEARS,
+    CONF_MERGED_CALENDAR,
     DOMAIN,
-    EVENT_TYPES,
-    WEDDING_ANNIVERSARIES,
-    AGE_CATEGORIES,
-    AGE_CATEGORY_ICONS,
-    WORK_MEDAL_LEVELS,
-    WORK_MEDAL_PENIBLE_LEVELS,
+    SUMMARY_CACHE_SIZE,
 )
+from .coordinator import DateCountdownCoordinator
+from .logging_utils import RateLimitedLogger
+from .lookup import get_age_category, get_wedding_type
+from .model import CountdownEvent
+from .occurrences import Occurrence, OccurrenceIndex, event_occurrences
+from .reconcile import async_setup_reconciliation
 
 _LOGGER = logging.getLogger(__name__)
+_SAMPLED_LOGGER = RateLimitedLogger(_LOGGER)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: Callable) -> None:
     """Set up Date Countdown calendars from a config entry."""
-    calendars = []
-    events = entry.options.get("events", [])
-    for event in events:
-        name = event.get("name")
-        first_name = event.get("first_name", "")
-        event_type = event.get("type")
-        event_date = event.get("date") or event.get("start_date")
-
-        if not name or not event_type or not event_date:
-            _LOGGER.warning("Skipping event due to missing required fields: %s", event)
-            continue
-
-        if event_type not in EVENT_TYPES:
-            _LOGGER.warning("Invalid event type '%s' for event: %s", event_type, event)
-            continue
-
-        calendars.append(DateCountdownCalendar(
-            name=name,
-            first_name=first_name,
-            event_type=event_type,
-            event_date=event_date,
-            death_date=event.get("death_date"),
-            is_penible=event.get("is_penible", False),
-            career_type=event.get("career_type", "normale"),
-            entry_id=entry.entry_id
-        ))
-
-    if calendars:
-        async_add_entities(calendars)
-        _LOGGER.info("%d Date Countdown calendar(s) created", len(calendars))
+    calendars: Dict[str, DateCountdownCalendar] = {}
+    coordinator: DateCountdownCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    summaries = SummaryCache(coordinator)
+    for event in coordinator.events:
+        calendars[event.unique_id] = DateCountdownCalendar(coordinator=coordinator, event=event, summaries=summaries)
+
+    async_setup_reconciliation(
+        hass,
+        entry,
+        calendars,
+        lambda event: DateCountdownCalendar(coordinator=coordinator, event=event, summaries=summaries),
+        async_add_entities,
+    )
+    entities: List[CalendarEntity] = list(calendars.values())
+    # Le calendrier fusionné existe même sans événement, pour accueillir ceux ajoutés ensuite
+    if entry.options.get(CONF_MERGED_CALENDAR, False):
+        entities.append(DateCountdownEntryCalendar(coordinator=coordinator, entry=entry, summaries=summaries))
+
+    if entities:
+        async_add_entities(entities)
+        _LOGGER.info("%d Date Countdown calendar(s) created", len(entities))
     else:
         _LOGGER.warning("No valid events found to create calendars")
 
-class DateCountdownCalendar(CalendarEntity):
-    """A calendar entity for Date Countdown events."""
+def calendar_name(event: CountdownEvent) -> str:
+    """Return the name of the calendar of an event."""
+    return f"{event.first_name} {event.name} - {event.event_type}".strip()
+
+def _all_day_event(day: date, summary: str) -> CalendarEvent:
+    """Build a calendar event covering a local day."""
+    tzinfo = dt_util.DEFAULT_TIME_ZONE
+    start = datetime.combine(day, time(0, 0), tzinfo=tzinfo)
+    end = datetime.combine(day, time(23, 59), tzinfo=tzinfo)
+    return CalendarEvent(start=start, end=end, summary=summary)
+
+def _query_window(start_date: datetime, end_date: datetime) -> Tuple[date, date]:
+    """Return the days of a calendar query, limited to CALENDAR_MAX_YEARS years."""
+    max_end = date(min(start_date.year + CALENDAR_MAX_YEARS, date.max.year), 12, 31)
+    return start_date.date(), min(end_date.date(), max_end)
+
+def generate_event_summary(name: str, event: CountdownEvent, years: int, today: date) -> str:
+    """Generate a summary for a yearly occurrence based on event type and years.
+
+    ``today`` is the local date of the query, used for the years since death.
+    """
+    summary = f"{name}"
+    if event.event_type == "birthday":
+        age_category, _ = get_age_category(years)
+        if age_category:
+            summary += f" ({years} ans, {age_category})"
+        else:
+            summary += f" ({years} ans)"
+    elif event.event_type == "anniversary":
+        wedding_type = get_wedding_type(years)
+        if wedding_type:
+            summary += f" ({years} ans, {wedding_type})"
+        else:
+            summary += f" ({years} ans)"
+    elif event.event_type == "memorial":
+        age_if_alive = years
+        years_since_death = None
+        if event.death_date:
+            years_since_death = today.year - event.death_date.year
+            if (today.month, today.day) < (event.death_date.month, event.death_date.day):
+                years_since_death -= 1
+        if years_since_death is not None:
+            summary += f" (Âge si vivant: {age_if_alive} ans, Depuis décès: {years_since_death} ans)"
+        else:
+            summary += f" (Âge si vivant: {age_if_alive} ans)"
+    elif event.event_type in ["promotion", "special_event"]:
+        summary += f" ({years} ans)"
+    return summary
+
+def generate_retirement_summary(name: str, event: CountdownEvent) -> str:
+    """Generate the summary of a retirement occurrence."""
+    years_worked = event.retirement_date.year - event.event_date.year
+    work_medal = event.medal_table.resolve(years_worked)
+    return f"{name} (Retraite, Médaille: {work_medal or 'Aucune'})"
+
+def occurrence_summary(event: CountdownEvent, years: int, today: date) -> str:
+    """Generate the summary of the occurrence of an event ``years`` years after its date."""
+    name = calendar_name(event)
+    if event.event_type == "retirement":
+        return generate_retirement_summary(name, event)
+    return generate_event_summary(name, event, years, today)
+
+class SummaryCache:
+    """Summaries of the occurrences of the events of an entry, keyed on (event, years).
+
+    Shared by the calendars of an entry, so a 50-year window reuses the
+    summaries already built instead of formatting them again. Memorial
+    summaries depend on the current day, and edits may rename events, so the
+    cache is emptied on a new day or a new event list.
+    """
+
+    def __init__(self, coordinator: DateCountdownCoordinator, maxsize: int = SUMMARY_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self._coordinator = coordinator
+        self._cache: LRUCache[str] = LRUCache(maxsize)
+        self._today: Optional[date] = None
+        self._events: Optional[List[CountdownEvent]] = None
+
+    def summary(self, event: CountdownEvent, years: int, today: date) -> str:
+        """Return the summary of the occurrence of an event ``years`` years after its date."""
+        if today != self._today or self._coordinator.events is not self._events:
+            self._cache.clear()
+            self._today = today
+            self._events = self._coordinator.events
+        key = (event.unique_id, years)
+        summary = self._cache.get(key)
+        self._coordinator.stats.record_summary(summary is not None)
+        if summary is None:
+            summary = occurrence_summary(event, years, today)
+            self._cache.put(key, summary)
+        return summary
+
+def iter_calendar_events(
+    occurrences: Iterable[Occurrence], summaries: SummaryCache, today: date
+) -> Iterator[CalendarEvent]:
+    """Turn a stream of occurrences into calendar events, one at a time."""
+    for day, event, years in occurrences:
+        yield _all_day_event(day, summaries.summary(event, years, today))
+
+class DateCountdownCalendar(CoordinatorEntity[DateCountdownCoordinator], CalendarEntity):
+    """A calendar entity for Date Countdown events.
+
+    The calendar reads its event from the coordinator by unique_id instead of
+    copying it. Its cache of date windows is only created once queried, and
+    only dropped when its event changes.
+    """
 
     def __init__(
         self,
-        name: str,
-        first_name: str,
-        event_type: str,
-        event_date: str,
-        death_date: Optional[str],
-        is_penible: bool,
-        career_type: str,
-        entry_id: str
+        coordinator: DateCountdownCoordinator,
+        event: CountdownEvent,
+        summaries: SummaryCache
     ):
         """Initialize the calendar entity."""
-        self._name = name
-        self._first_name = first_name
-        self._event_type = event_type
-        self._event_date_str = event_date
-        self._death_date_str = death_date
-        self._is_penible = is_penible
-        self._career_type = career_type
-        self._event_date = self._parse_date(event_date)
-        self._death_date = self._parse_date(death_date) if death_date else None
-        self._attr_unique_id = f"{event_type}_{name.lower().replace(' ', '_')}_{event_date.replace('/', '')}"
-        self._attr_name = f"{first_name} {name} - {event_type}".strip()
-        self._entry_id = entry_id
+        super().__init__(coordinator)
+        self._summaries = summaries
+        self._attr_unique_id = event.unique_id
+        self._attr_name = calendar_name(event)
+        self._events_cache: Optional[LRUCache[List[CalendarEvent]]] = None
+        self._values: Optional[tuple] = None
         self._next_event: Optional[CalendarEvent] = None
+        self._update_from_coordinator()
 
-    def _parse_date(self, date_str: str) -> Optional[date]:
-        """Parse a date string in DD/MM/YYYY format."""
-        try:
-            day, month, year = map(int, date_str.split("/"))
-            return date(year, month, day)
-        except Exception as e:
-            _LOGGER.error("Invalid date format for %s: %s", self._name, e)
-            return None
+    @property
+    def _countdown_event(self) -> Optional[CountdownEvent]:
+        """Return the event of the calendar, or None once it has been removed."""
+        return self.coordinator.events_by_id.get(self._attr_unique_id)
+
+    @callback
+    def async_set_event(self, event: CountdownEvent) -> None:
+        """Apply a modified event without recreating the calendar."""
+        self._attr_name = calendar_name(event)
+        self._values = None
+        self._update_from_coordinator()
+        if self.hass is not None:
+            self.async_write_ha_state()
 
     @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._entry_id)},
-            "name": "Date Countdown",
-            "manufacturer": "XAV59213"
-        }
+    def device_info(self) -> Dict[str, Any]:
+        """Return the device of the entry, shared by all its entities."""
+        return self.coordinator.device_info
 
     @property
     def event(self) -> Optional[CalendarEvent]:
         """Return the next upcoming event."""
-        if not self._event_date:
+        return self._next_event
+
+    def _build_next_event(self) -> Optional[CalendarEvent]:
+        """Build the next upcoming event from the coordinator data."""
+        event = self._countdown_event
+        if event is None:
             return None
 
+        data = self.coordinator.get_event_state(self._attr_unique_id)
+        if data is None or data["next_date"] is None:
+            return None
+
+        next_date = data["next_date"]
         today = dt_util.now().date()
-        tzinfo = dt_util.DEFAULT_TIME_ZONE
-
-        if self._event_type == "retirement":
-            # Calculer la date de retraite estimée
-            if self._career_type == "longue":
-                years_to_retirement = 60 - 17  # Retraite à 60 ans, début à 17 ans
-            else:
-                years_to_retirement = 64 - 19  # Retraite à 64 ans, début à 19 ans
-
-            retirement_year = self._event_date.year + years_to_retirement
-            try:
-                retirement_date = date(retirement_year, self._event_date.month, self._event_date.day)
-            except ValueError as e:
-                _LOGGER.error("Invalid retirement date for %s: %s", self._attr_name, e)
-                return None
-
-            if retirement_date < today:
+        if event.event_type == "retirement":
+            if next_date < today:
                 # Retraite passée : indiquer comme événement terminé
-                start = datetime.combine(retirement_date, time(0, 0), tzinfo=tzinfo)
-                end = datetime.combine(retirement_date, time(23, 59), tzinfo=tzinfo)
-                summary = f"{self._attr_name} (Retraite atteinte)"
-                return CalendarEvent(start=start, end=end, summary=summary)
+                return _all_day_event(next_date, f"{self._attr_name} (Retraite atteinte)")
 
             # Retraite future : retourner la date de retraite
-            start = datetime.combine(retirement_date, time(0, 0), tzinfo=tzinfo)
-            end = datetime.combine(retirement_date, time(23, 59), tzinfo=tzinfo)
-            years_worked = retirement_date.year - self._event_date.year
-            work_medal = self._calculate_work_medal(years_worked)
+            years_worked = next_date.year - event.event_date.year
+            work_medal = event.medal_table.resolve(years_worked)
             summary = f"{self._attr_name} (Retraite dans {years_worked} ans, Médaille: {work_medal or 'Aucune'})"
-            return CalendarEvent(start=start, end=end, summary=summary)
+            return _all_day_event(next_date, summary)
 
         # Pour les autres types, retourner l'événement annuel le plus proche
-        next_date = date(today.year, self._event_date.month, self._event_date.day)
-        if next_date < today:
-            next_date = date(today.year + 1, self._event_date.month, self._event_date.day)
-
-        start = datetime.combine(next_date, time(0, 0), tzinfo=tzinfo)
-        end = datetime.combine(next_date, time(23, 59), tzinfo=tzinfo)
-        years = next_date.year - self._event_date.year
-        summary = self._generate_event_summary(years)
-
-        return CalendarEvent(start=start, end=end, summary=summary)
-
-    def _calculate_work_medal(self, years_worked: int) -> Optional[str]:
-        """Calculate the work medal based on years worked."""
-        medal_levels = WORK_MEDAL_PENIBLE_LEVELS if self._is_penible else WORK_MEDAL_LEVELS
-        for years_required, level in sorted(medal_levels.items()):
-            if years_worked >= years_required:
-                return level
-        return None
-
-    def _generate_event_summary(self, years: int) -> str:
-        """Generate a summary for the calendar event based on event type and years."""
-        summary = f"{self._attr_name}"
-        if self._event_type == "birthday":
-            age_category = None
-            for (min_age, max_age), category in AGE_CATEGORIES.items():
-                if min_age <= years <= max_age:
-                    age_category = category
-                    break
-            if age_category:
-                summary += f" ({years} ans, {age_category})"
-            else:
-                summary += f" ({years} ans)"
-        elif self._event_type == "anniversary":
-            wedding_type = WEDDING_ANNIVERSARIES.get(years)
-            if wedding_type:
-                summary += f" ({years} ans, {wedding_type})"
-            else:
-                summary += f" ({years} ans)"
-        elif self._event_type == "memorial":
-            age_if_alive = years
-            years_since_death = None
-            if self._death_date:
-                years_since_death = date.today().year - self._death_date.year
-                if (date.today().month, date.today().day) < (self._death_date.month, self._death_date.day):
-                    years_since_death -= 1
-            if years_since_death is not None:
-                summary += f" (Âge si vivant: {age_if_alive} ans, Depuis décès: {years_since_death} ans)"
-            else:
-                summary += f" (Âge si vivant: {age_if_alive} ans)"
-        elif self._event_type in ["promotion", "special_event"]:
-            summary += f" ({years} ans)"
-        return summary
+        years = next_date.year - event.event_date.year
+        return _all_day_event(next_date, self._summaries.summary(event, years, today))
 
     async def async_get_events(self, hass: HomeAssistant, start_date: datetime, end_date: datetime) -> List[CalendarEvent]:
-        """Return calendar events within the specified date range for the next 50 years."""
-        if not self._event_date:
+        """Return calendar events within the specified date range, over at most 50 years."""
+        event = self._countdown_event
+        if event is None:
             _LOGGER.warning("No valid event date for %s, skipping event generation", self._attr_name)
             return []
 
-        events = []
-        tzinfo = dt_util.DEFAULT_TIME_ZONE
+        started = perf_counter()
+        window_days = (end_date - start_date).days
         today = dt_util.now().date()
-        max_years = 50
-        end_year = min(start_date.year + max_years, end_date.year)
-
-        if self._event_type == "retirement":
-            # Calculer la date de retraite
-            if self._career_type == "longue":
-                years_to_retirement = 60 - 17
-            else:
-                years_to_retirement = 64 - 19
-
-            retirement_year = self._event_date.year + years_to_retirement
-            try:
-                retirement_date = date(retirement_year, self._event_date.month, self._event_date.day)
-            except ValueError as e:
-                _LOGGER.error("Invalid retirement date for %s: %s", self._attr_name, e)
-                return []
-
-            if start_date.date() <= retirement_date <= end_date.date():
-                start = datetime.combine(retirement_date, time(0, 0), tzinfo=tzinfo)
-                end = datetime.combine(retirement_date, time(23, 59), tzinfo=tzinfo)
-                years_worked = retirement_date.year - self._event_date.year
-                work_medal = self._calculate_work_medal(years_worked)
-                summary = f"{self._attr_name} (Retraite, Médaille: {work_medal or 'Aucune'})"
-                events.append(CalendarEvent(start=start, end=end, summary=summary))
-            return events
-
-        # Pour les autres types d'événements, générer des occurrences annuelles
-        for year in range(start_date.year, end_year + 1):
-            try:
-                event_date = date(year, self._event_date.month, self._event_date.day)
-            except ValueError as e:
-                _LOGGER.warning("Invalid date for year %s for %s: %s", year, self._attr_name, e)
-                continue
-
-            if start_date.date() <= event_date <= end_date.date():
-                start = datetime.combine(event_date, time(0, 0), tzinfo=tzinfo)
-                end = datetime.combine(event_date, time(23, 59), tzinfo=tzinfo)
-                years = year - self._event_date.year
-                summary = self._generate_event_summary(years)
-                events.append(CalendarEvent(start=start, end=end, summary=summary))
-
-        _LOGGER.debug("Generated %d events for %s between %s and %s", len(events), self._attr_name, start_date, end_date)
+        cache_key = (start_date, end_date, today)
+        if self._events_cache is None:
+            self._events_cache = LRUCache(CALENDAR_CACHE_SIZE)
+        cached = self._events_cache.get(cache_key)
+        if cached is not None:
+            self.coordinator.stats.record_get_events(window_days, 0, True, perf_counter() - started)
+            return list(cached)
+
+        events = self._generate_events(event, start_date, end_date, today)
+        self._events_cache.put(cache_key, events)
+        self.coordinator.stats.record_get_events(window_days, len(events), False, perf_counter() - started)
+        return list(events)
+
+    def _generate_events(
+        self, event: CountdownEvent, start_date: datetime, end_date: datetime, today: date
+    ) -> List[CalendarEvent]:
+        """Build the calendar events of the date range."""
+        window_start, window_end = _query_window(start_date, end_date)
+        occurrences = event_occurrences(event, window_start, window_end)
+        events = list(iter_calendar_events(occurrences, self._summaries, today))
+        _SAMPLED_LOGGER.debug("get_events", "Generated %d events for %s between %s and %s", len(events), self._attr_name, start_date, end_date)
         return events
 
-    async def async_update(self) -> None:
-        """Update the next event."""
-        self._next_event = self.event
+    def _update_from_coordinator(self) -> bool:
+        """Rebuild the next event if the event, its state or the availability changed.
+
+        The coordinator keeps the objects of unchanged events and states, so
+        they are compared by identity. Return whether anything changed.
+        """
+        values = (
+            self.coordinator.last_update_success,
+            self._countdown_event,
+            self.coordinator.get_event_state(self._attr_unique_id),
+        )
+        old_values = self._values
+        if old_values is not None and values[0] == old_values[0] and all(
+            new is old for new, old in zip(values[1:], old_values[1:])
+        ):
+            return False
+        if old_values is None or values[1] is not old_values[1]:
+            self._events_cache = None
+        self._values = values
+        self._next_event = self._build_next_event()
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, writing the state only on change."""
+        if self._update_from_coordinator():
+            super()._handle_coordinator_update()
+
+class DateCountdownEntryCalendar(CoordinatorEntity[DateCountdownCoordinator], CalendarEntity):
+    """A single calendar merging every event of a config entry."""
+
+    def __init__(self, coordinator: DateCountdownCoordinator, entry: ConfigEntry, summaries: SummaryCache):
+        """Initialize the merged calendar entity."""
+        super().__init__(coordinator)
+        self._entry_id = entry.entry_id
+        self._summaries = summaries
+        self._index_events()
+        self._attr_unique_id = f"{entry.entry_id}_calendar"
+        self._attr_name = f"Date Countdown - {entry.title}"
+        self._events_cache: LRUCache[List[CalendarEvent]] = LRUCache(CALENDAR_CACHE_SIZE)
+        self._next_event: Optional[CalendarEvent] = self._build_next_event()
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        """Return the device of the entry, shared by all its entities."""
+        return self.coordinator.device_info
+
+    @property
+    def event(self) -> Optional[CalendarEvent]:
+        """Return the next upcoming event of the entry."""
+        return self._next_event
+
+    def _index_events(self) -> None:
+        """Index the current events of the coordinator."""
+        self._indexed_events = self.coordinator.events
+        self._index = OccurrenceIndex(self._indexed_events)
+
+    def _build_next_event(self) -> Optional[CalendarEvent]:
+        """Build the next occurrence within the coming year."""
+        today = dt_util.now().date()
+        occurrences = self._index.query(today, today + timedelta(days=366))
+        return next(iter_calendar_events(occurrences, self._summaries, today), None)
+
+    async def async_get_events(self, hass: HomeAssistant, start_date: datetime, end_date: datetime) -> List[CalendarEvent]:
+        """Return the events of every entry event within the date range."""
+        started = perf_counter()
+        window_days = (end_date - start_date).days
+        today = dt_util.now().date()
+        cache_key = (start_date, end_date, today)
+        cached = self._events_cache.get(cache_key)
+        if cached is not None:
+            self.coordinator.stats.record_get_events(window_days, 0, True, perf_counter() - started)
+            return list(cached)
+
+        window_start, window_end = _query_window(start_date, end_date)
+        occurrences = self._index.query(window_start, window_end)
+        events = list(iter_calendar_events(occurrences, self._summaries, today))
+        _LOGGER.debug("Generated %d merged events for entry %s between %s and %s", len(events), self._entry_id, start_date, end_date)
+        self._events_cache.put(cache_key, events)
+        self.coordinator.stats.record_get_events(window_days, len(events), False, perf_counter() - started)
+        return list(events)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, reindexing edited events."""
+        if self._indexed_events is not self.coordinator.events:
+            self._index_events()
+        self._events_cache.clear()
+        self._next_event = self._build_next_event()
+        super()._handle_coordinator_update()
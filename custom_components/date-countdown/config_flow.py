@@ -1,44 +1,121 @@
 """Config flow for Date Countdown integration.
 
 This module handles the configuration flow for the Date Countdown integration,
-allowing users to edit events through the Home Assistant UI.
+allowing users to add, edit and remove the events of an entry through the
+Home Assistant UI. An entry holds any number of events.
 The 'Saint du jour' and 'Jour férié' sensors are enabled by default and not configurable.
 """
 
 import logging
-from typing import Any, Dict, Optional
-import re
+from typing import Any, Dict, List, Optional
 import voluptuous as vol
-from datetime import date
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-
-from .const import DOMAIN, EVENT_TYPES, DATE_FORMAT
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DOMAIN,
+    EVENT_TYPES,
+    DATE_FORMAT,
+    CONF_MERGED_CALENDAR,
+    CONF_OFFLOAD_THRESHOLD,
+    CONF_STATS_SENSOR,
+    DEFAULT_OFFLOAD_THRESHOLD,
+)
+from .importer import async_import_events
+from .model import event_unique_id, generate_entry_title, validate_event_dates
+from .storage import async_commit_events, async_get_event_store
 
 _LOGGER = logging.getLogger(__name__)
 
-def _generate_entry_title(events: list) -> str:
-    """Generate a title for the config entry based on the list of events."""
-    if not events:
-        return "Compte à rebours d'événements (vide)"
-    event_type_labels = {
-        "birthday": "Anniversaire",
-        "anniversary": "Anniversaire de mariage",
-        "memorial": "Mémorial",
-        "promotion": "Promotion",
-        "special_event": "Événement spécial",
-        "retirement": "Retraite"
+OPTIONS_ACTIONS = ["add", "edit", "remove", "import", "settings"]
+IMPORT_ERRORS_SHOWN = 10
+
+EVENT_TYPE_OPTIONS = {
+    "birthday": "Anniversaire",
+    "anniversary": "Anniversaire de mariage",
+    "memorial": "Mémorial",
+    "promotion": "Promotion",
+    "special_event": "Événement spécial",
+    "retirement": "Retraite"
+}
+
+CAREER_TYPE_OPTIONS = {
+    "longue": "Carrière longue (début avant 18 ans)",
+    "normale": "Carrière normale (début après 18 ans)"
+}
+
+def _event_schema(event_type: str, event: Optional[Dict[str, Any]] = None, another: Optional[str] = None) -> vol.Schema:
+    """Return the form of the details of an event, prefilled with an existing event.
+
+    ``another`` adds the checkbox to continue with another event: "add_another"
+    or "edit_another".
+    """
+    event = event or {}
+    if event_type == "retirement":
+        schema = {
+            vol.Required("name", description="Nom de l'événement ou de la personne", default=event.get("name", vol.UNDEFINED)): str,
+            vol.Optional("first_name", description="Prénom (optionnel)", default=event.get("first_name", vol.UNDEFINED)): str,
+            vol.Required("start_date", description=f"Date de début du travail (format: {DATE_FORMAT})", default=event.get("start_date", vol.UNDEFINED)): str,
+            vol.Optional("is_penible", description="Travaux pénibles (réduit les années pour la médaille)", default=event.get("is_penible", False)): bool,
+            vol.Required("career_type", description="Type de carrière", default=event.get("career_type", "normale")): vol.In(CAREER_TYPE_OPTIONS)
+        }
+    else:
+        date_label = "Date de naissance" if event_type == "memorial" else "Date"
+        schema = {
+            vol.Required("name", description="Nom de l'événement ou de la personne", default=event.get("name", vol.UNDEFINED)): str,
+            vol.Optional("first_name", description="Prénom (optionnel)", default=event.get("first_name", vol.UNDEFINED)): str,
+            vol.Required("date", description=f"{date_label} (format: {DATE_FORMAT})", default=event.get("date", vol.UNDEFINED)): str,
+        }
+        if event_type == "memorial":
+            schema[vol.Optional("death_date", description=f"Date de décès (format: {DATE_FORMAT})", default=event.get("death_date", vol.UNDEFINED))] = str
+    if another == "add_another":
+        schema[vol.Optional(another, description="Ajouter un autre événement", default=False)] = bool
+    elif another == "edit_another":
+        schema[vol.Optional(another, description="Modifier un autre événement", default=False)] = bool
+    return vol.Schema(schema)
+
+def _build_event(event_type: str, user_input: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the stored event from a validated form."""
+    event = {
+        "name": user_input["name"],
+        "first_name": user_input.get("first_name", ""),
+        "type": event_type
     }
-    event_names = []
-    for event in events[:2]:
-        prefix = f"{event.get('first_name', '')} {event['name']}".strip()
-        event_type_name = event_type_labels.get(event["type"], event["type"])
-        event_names.append(f"{prefix} - {event_type_name}")
-    title = ", ".join(event_names)
-    if len(events) > 2:
-        title += "..."
-    return title
+    if event_type == "retirement":
+        event["start_date"] = user_input["start_date"]
+        event["is_penible"] = user_input.get("is_penible", False)
+        event["career_type"] = user_input.get("career_type", "normale")
+    elif event_type == "memorial" and user_input.get("death_date"):
+        event["death_date"] = user_input["death_date"]
+        event["date"] = user_input["date"]
+    else:
+        event["date"] = user_input["date"]
+    return event
+
+def _event_options(events: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Return the labels of the valid events, keyed by their index."""
+    event_options = {}
+    for i, event in enumerate(events):
+        if "name" in event and "type" in event:
+            event_options[str(i)] = f"{event.get('first_name', '')} {event['name']} ({event['type']})".strip()
+        else:
+            _LOGGER.warning("Invalid event at index %s: %s", i, event)
+    return event_options
+
+def _validate_new_event(event_type: str, user_input: Dict[str, Any], events: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Validate the form of an event added to a list of events."""
+    errors = validate_event_dates(event_type, user_input)
+    for field in errors:
+        _LOGGER.error("Invalid %s for new event: %s", field, user_input.get(field))
+    if not errors:
+        unique_id = event_unique_id(_build_event(event_type, user_input))
+        if any("name" in event and "type" in event and event_unique_id(event) == unique_id for event in events):
+            _LOGGER.error("Event %s already exists in the entry", unique_id)
+            errors["base"] = "duplicate_event"
+    return errors
 
 class DateCountdownConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Date Countdown."""
@@ -48,6 +125,7 @@ class DateCountdownConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize the config flow."""
         self._event_type = None
+        self._events: List[Dict[str, Any]] = []
 
     async def async_step_user(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle the initial step to select event type."""
@@ -57,124 +135,49 @@ class DateCountdownConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.info("Selected event type: %s", self._event_type)
             return await self.async_step_event_details()
 
-        event_type_options = {
-            "birthday": "Anniversaire",
-            "anniversary": "Anniversaire de mariage",
-            "memorial": "Mémorial",
-            "promotion": "Promotion",
-            "special_event": "Événement spécial",
-            "retirement": "Retraite"
-        }
-
         _LOGGER.info("Showing form for step 'user' to select event type")
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema({
-                vol.Required("type", description="Type d'événement"): vol.In(event_type_options),
+                vol.Required("type", description="Type d'événement"): vol.In(EVENT_TYPE_OPTIONS),
             }),
-            description_placeholders={"date_format": DATE_FORMAT}
+            description_placeholders={"date_format": DATE_FORMAT, "count": str(len(self._events))}
         )
 
     async def async_step_event_details(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
-        """Handle the step to collect event details."""
+        """Handle the step to collect event details, then add another event or create the entry."""
         _LOGGER.debug("async_step_event_details called with user_input: %s", user_input)
         errors = {}
 
         if user_input is not None:
             _LOGGER.debug("Processing event details: %s", user_input)
-            # Validation des dates
-            if self._event_type == "retirement":
-                if not re.match(r"^\d{2}/\d{2}/\d{4}$", user_input["start_date"]):
-                    errors["start_date"] = "invalid_date_format"
-                    _LOGGER.error("Invalid start date format: %s", user_input["start_date"])
-                if not errors:
-                    try:
-                        day, month, year = map(int, user_input["start_date"].split('/'))
-                        date(year, month, day)
-                    except (ValueError, TypeError) as e:
-                        errors["start_date"] = "invalid_date_format"
-                        _LOGGER.error("Date validation failed for start_date %s: %s", user_input["start_date"], e)
-            else:
-                if not re.match(r"^\d{2}/\d{2}/\d{4}$", user_input["date"]):
-                    errors["date"] = "invalid_date_format"
-                    _LOGGER.error("Invalid date format: %s", user_input["date"])
-                elif self._event_type == "memorial" and user_input.get("death_date"):
-                    if not re.match(r"^\d{2}/\d{2}/\d{4}$", user_input["death_date"]):
-                        errors["death_date"] = "invalid_memorial_date"
-                        _LOGGER.error("Invalid death date format: %s", user_input["death_date"])
-                    else:
-                        try:
-                            day, month, year = map(int, user_input["death_date"].split('/'))
-                            date(year, month, day)
-                        except (ValueError, TypeError) as e:
-                            errors["death_date"] = "invalid_memorial_date"
-                            _LOGGER.error("Date validation failed for death_date %s: %s", user_input["death_date"], e)
-                if not errors:
-                    try:
-                        day, month, year = map(int, user_input["date"].split('/'))
-                        date(year, month, day)
-                    except (ValueError, TypeError) as e:
-                        errors["date"] = "invalid_date_format"
-                        _LOGGER.error("Date validation failed for date %s: %s", user_input["date"], e)
+            errors = _validate_new_event(self._event_type, user_input, self._events)
 
             if not errors:
-                _LOGGER.info("Creating entry with initial event: %s", user_input)
-                initial_events = [
-                    {
-                        "name": user_input["name"],
-                        "first_name": user_input.get("first_name", ""),
-                        "type": self._event_type
-                    }
-                ]
-                if self._event_type == "retirement":
-                    initial_events[0]["start_date"] = user_input["start_date"]
-                    initial_events[0]["is_penible"] = user_input.get("is_penible", False)
-                    initial_events[0]["career_type"] = user_input.get("career_type", "normale")
-                elif self._event_type == "memorial" and user_input.get("death_date"):
-                    initial_events[0]["death_date"] = user_input["death_date"]
-                    initial_events[0]["date"] = user_input["date"]
-                else:
-                    initial_events[0]["date"] = user_input["date"]
-                _LOGGER.debug("Prepared initial_events: %s", initial_events)
+                self._events.append(_build_event(self._event_type, user_input))
+                if user_input.get("add_another"):
+                    _LOGGER.info("Event %d collected, adding another one", len(self._events))
+                    self._event_type = None
+                    return await self.async_step_user()
+
+                _LOGGER.info("Creating entry with %d event(s)", len(self._events))
+                _LOGGER.debug("Prepared events: %s", self._events)
                 try:
                     result = self.async_create_entry(
-                        title=_generate_entry_title(initial_events),
+                        title=generate_entry_title(self._events),
                         data={},
-                        options={"events": initial_events}
+                        options={"events": self._events}
                     )
-                    _LOGGER.info("Entry created successfully, title: %s", _generate_entry_title(initial_events))
+                    _LOGGER.info("Entry created successfully, title: %s", generate_entry_title(self._events))
                     return result
                 except Exception as e:
                     _LOGGER.error("Failed to create entry: %s", e)
                     errors["base"] = "creation_failed"
 
-        # Schéma pour la retraite
-        if self._event_type == "retirement":
-            career_type_options = {
-                "longue": "Carrière longue (début avant 18 ans)",
-                "normale": "Carrière normale (début après 18 ans)"
-            }
-            schema = {
-                vol.Required("name", description="Nom de l'événement ou de la personne"): str,
-                vol.Optional("first_name", description="Prénom (optionnel)"): str,
-                vol.Required("start_date", description=f"Date de début du travail (format: {DATE_FORMAT})"): str,
-                vol.Optional("is_penible", description="Travaux pénibles (réduit les années pour la médaille)"): bool,
-                vol.Required("career_type", description="Type de carrière", default="normale"): vol.In(career_type_options)
-            }
-        else:
-            date_label = "Date de naissance" if self._event_type == "memorial" else "Date"
-            schema = {
-                vol.Required("name", description="Nom de l'événement ou de la personne"): str,
-                vol.Optional("first_name", description="Prénom (optionnel)"): str,
-                vol.Required("date", description=f"{date_label} (format: {DATE_FORMAT})"): str,
-            }
-            if self._event_type == "memorial":
-                schema[vol.Optional("death_date", description=f"Date de décès (format: {DATE_FORMAT})")] = str
-
         _LOGGER.info("Showing form for step 'event_details' with event_type: %s", self._event_type)
         return self.async_show_form(
             step_id="event_details",
-            data_schema=vol.Schema(schema),
+            data_schema=_event_schema(self._event_type, user_input, another="add_another"),
             errors=errors,
             description_placeholders={"date_format": DATE_FORMAT}
         )
@@ -187,7 +190,7 @@ class DateCountdownConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return DateCountdownOptionsFlow(config_entry)
 
 class DateCountdownOptionsFlow(config_entries.OptionsFlow):
-    """Handle options flow for Date Countdown, limited to editing events."""
+    """Handle options flow for Date Countdown: add, edit, remove and import events."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry):
         """Initialize options flow."""
@@ -195,245 +198,288 @@ class DateCountdownOptionsFlow(config_entries.OptionsFlow):
         self._config_entry_id = config_entry.entry_id
         self.events = None
         self._event_type = None
+        self._event_index = 0
+        self._added = 0
+        self._import_report: Dict[str, Any] = {}
+
+    def _show_init_form(self, errors: Optional[Dict[str, str]] = None) -> FlowResult:
+        """Show the choice of action."""
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required("action", default="add" if not self.events else "edit"): vol.In(OPTIONS_ACTIONS)
+            }),
+            errors=errors
+        )
+
+    async def _async_commit(self) -> FlowResult:
+        """Save the edited events in a single store commit and close the flow."""
+        config_entry = self.hass.config_entries.async_get_entry(self._config_entry_id)
+        _LOGGER.info("Updated events list, %d event(s)", len(self.events))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Updated events list: %s", self.events)
+        await async_commit_events(self.hass, config_entry, self.events)
+        _LOGGER.info("Applied events to config entry %s", self._config_entry_id)
+        return self.async_create_entry(title="", data=dict(config_entry.options))
 
     async def async_step_init(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
-        """Manage the options, limited to editing."""
+        """Manage the events and settings of the entry."""
         _LOGGER.debug("async_step_init called with user_input: %s", user_input)
         if self.events is None:
             config_entry = self.hass.config_entries.async_get_entry(self._config_entry_id)
             if not config_entry:
                 _LOGGER.error("Config entry %s not found", self._config_entry_id)
-                return self.async_show_form(
-                    step_id="init",
-                    data_schema=vol.Schema({
-                        vol.Required("action"): vol.In(["edit"])
-                    }),
-                    errors={"base": "config_entry_not_found"}
-                )
-            self.events = config_entry.options.get("events", [])
+                return self._show_init_form({"base": "config_entry_not_found"})
+            store = await async_get_event_store(self.hass, config_entry)
+            self.events = list(store.events)
             _LOGGER.debug("Initialized events: %s", self.events)
 
-        if not self.events:
-            _LOGGER.warning("No events available for editing")
-            return self.async_show_form(
-                step_id="init",
-                data_schema=vol.Schema({
-                    vol.Required("action"): vol.In(["edit"])
-                }),
-                errors={"base": "no_events"}
-            )
-
         if user_input is not None:
             action = user_input.get("action")
             _LOGGER.debug("Action selected: %s", action)
-            if action != "edit":
+            if action not in OPTIONS_ACTIONS:
                 _LOGGER.warning("Invalid action received: %s", action)
-                return self.async_show_form(
-                    step_id="init",
-                    data_schema=vol.Schema({
-                        vol.Required("action"): vol.In(["edit"])
-                    }),
-                    errors={"action": "invalid_action"}
-                )
-            _LOGGER.info("Selected action: edit")
-            return await self.async_step_select_event({})
-
-        _LOGGER.info("Showing form for step 'init' with action: edit")
+                return self._show_init_form({"action": "invalid_action"})
+            if action in ("edit", "remove") and not _event_options(self.events):
+                _LOGGER.warning("No events available for action %s", action)
+                return self._show_init_form({"base": "no_events"})
+            _LOGGER.info("Selected action: %s", action)
+            if action == "add":
+                return await self.async_step_add_event_type()
+            if action == "remove":
+                return await self.async_step_remove_events()
+            if action == "settings":
+                return await self.async_step_settings()
+            if action == "import":
+                return await self.async_step_import_events()
+            return await self.async_step_select_event()
+
+        _LOGGER.info("Showing form for step 'init' with actions: %s", OPTIONS_ACTIONS)
+        return self._show_init_form()
+
+    async def async_step_settings(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
+        """Handle the settings of the config entry."""
+        _LOGGER.debug("async_step_settings called with user_input: %s", user_input)
+        config_entry = self.hass.config_entries.async_get_entry(self._config_entry_id)
+        if user_input is not None:
+            options = {
+                **config_entry.options,
+                CONF_MERGED_CALENDAR: user_input.get(CONF_MERGED_CALENDAR, False),
+                CONF_STATS_SENSOR: user_input.get(CONF_STATS_SENSOR, False),
+                CONF_OFFLOAD_THRESHOLD: user_input.get(CONF_OFFLOAD_THRESHOLD, DEFAULT_OFFLOAD_THRESHOLD),
+            }
+            _LOGGER.info("Updated settings for config entry %s: merged_calendar=%s, stats_sensor=%s, offload_threshold=%s",
+                         self._config_entry_id, options[CONF_MERGED_CALENDAR], options[CONF_STATS_SENSOR],
+                         options[CONF_OFFLOAD_THRESHOLD])
+            return self.async_create_entry(title="", data=options)
+
         return self.async_show_form(
-            step_id="init",
+            step_id="settings",
             data_schema=vol.Schema({
-                vol.Required("action", default="edit"): vol.In(["edit"])
+                vol.Optional(
+                    CONF_MERGED_CALENDAR,
+                    description="Calendrier unique regroupant tous les événements",
+                    default=config_entry.options.get(CONF_MERGED_CALENDAR, False)
+                ): bool,
+                vol.Optional(
+                    CONF_STATS_SENSOR,
+                    description="Capteur de diagnostic des performances",
+                    default=config_entry.options.get(CONF_STATS_SENSOR, False)
+                ): bool,
+                vol.Optional(
+                    CONF_OFFLOAD_THRESHOLD,
+                    description="Nombre d'événements à partir duquel le calcul quitte la boucle",
+                    default=config_entry.options.get(CONF_OFFLOAD_THRESHOLD, DEFAULT_OFFLOAD_THRESHOLD)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
             })
         )
 
+    async def async_step_import_events(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
+        """Handle the bulk import of events from a file."""
+        _LOGGER.debug("async_step_import_events called with user_input: %s", user_input)
+        errors = {}
+        if user_input is not None:
+            config_entry = self.hass.config_entries.async_get_entry(self._config_entry_id)
+            try:
+                self._import_report = await async_import_events(self.hass, config_entry, user_input["path"])
+            except HomeAssistantError as e:
+                _LOGGER.error("Failed to import events: %s", e)
+                errors["path"] = "import_failed"
+            else:
+                return await self.async_step_import_result()
+
+        return self.async_show_form(
+            step_id="import_events",
+            data_schema=vol.Schema({
+                vol.Required("path", description="Chemin du fichier CSV, JSON ou ICS"): str,
+            }),
+            errors=errors,
+            description_placeholders={"date_format": DATE_FORMAT}
+        )
+
+    async def async_step_import_result(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
+        """Show the report of the bulk import."""
+        config_entry = self.hass.config_entries.async_get_entry(self._config_entry_id)
+        if user_input is not None:
+            return self.async_create_entry(title="", data=dict(config_entry.options))
+
+        report = self._import_report
+        lines = [
+            f"Ligne {error['row']} : {', '.join(f'{field} ({key})' for field, key in error['errors'].items())}"
+            for error in report["errors"][:IMPORT_ERRORS_SHOWN]
+        ]
+        if len(report["errors"]) > IMPORT_ERRORS_SHOWN:
+            lines.append(f"... et {len(report['errors']) - IMPORT_ERRORS_SHOWN} autre(s)")
+        return self.async_show_form(
+            step_id="import_result",
+            data_schema=vol.Schema({}),
+            description_placeholders={
+                "imported": str(report["imported"]),
+                "rejected": str(len(report["errors"])),
+                "errors": "\n".join(lines) or "-",
+            }
+        )
+
+    async def async_step_add_event_type(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
+        """Handle selecting the type of an event to add."""
+        _LOGGER.debug("async_step_add_event_type called with user_input: %s", user_input)
+        if user_input is not None:
+            self._event_type = user_input["type"]
+            _LOGGER.info("Selected event type to add: %s", self._event_type)
+            return await self.async_step_add_event()
+
+        return self.async_show_form(
+            step_id="add_event_type",
+            data_schema=vol.Schema({
+                vol.Required("type", description="Type d'événement"): vol.In(EVENT_TYPE_OPTIONS),
+            }),
+            description_placeholders={"date_format": DATE_FORMAT, "count": str(self._added)}
+        )
+
+    async def async_step_add_event(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
+        """Handle the details of an added event, then add another one or save them all."""
+        _LOGGER.debug("async_step_add_event called with user_input: %s", user_input)
+        errors = {}
+        if user_input is not None:
+            errors = _validate_new_event(self._event_type, user_input, self.events)
+            if not errors:
+                self.events.append(_build_event(self._event_type, user_input))
+                self._added += 1
+                if user_input.get("add_another"):
+                    self._event_type = None
+                    return await self.async_step_add_event_type()
+                try:
+                    return await self._async_commit()
+                except Exception as e:
+                    _LOGGER.error("Failed to update entry after adding events: %s", e)
+                    errors["base"] = "update_failed"
+
+        return self.async_show_form(
+            step_id="add_event",
+            data_schema=_event_schema(self._event_type, user_input, another="add_another"),
+            errors=errors,
+            description_placeholders={"date_format": DATE_FORMAT}
+        )
+
+    async def async_step_remove_events(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
+        """Handle removing several events at once."""
+        _LOGGER.debug("async_step_remove_events called with user_input: %s", user_input)
+        event_options = _event_options(self.events)
+        errors = {}
+        if user_input is not None:
+            selected = {int(index) for index in user_input.get("events", []) if index in event_options}
+            if not selected:
+                errors["events"] = "event_required"
+            else:
+                _LOGGER.info("Removing %d event(s)", len(selected))
+                self.events = [event for i, event in enumerate(self.events) if i not in selected]
+                try:
+                    return await self._async_commit()
+                except Exception as e:
+                    _LOGGER.error("Failed to update entry after removing events: %s", e)
+                    errors["base"] = "update_failed"
+
+        return self.async_show_form(
+            step_id="remove_events",
+            data_schema=vol.Schema({
+                vol.Required("events", description="Événements à supprimer"): cv.multi_select(event_options),
+            }),
+            errors=errors
+        )
+
     async def async_step_select_event(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle selecting an event to edit."""
         _LOGGER.debug("async_step_select_event called with user_input: %s", user_input)
-        if not self.events:
-            _LOGGER.warning("No events available for selection")
-            return self.async_show_form(
-                step_id="init",
-                data_schema=vol.Schema({
-                    vol.Required("action"): vol.In(["edit"])
-                }),
-                errors={"base": "no_events"}
-            )
-
-        event_options = {}
-        for i, event in enumerate(self.events):
-            if "name" in event and "type" in event:
-                event_options[str(i)] = f"{event['name']} ({event['type']})"
-            else:
-                _LOGGER.warning("Invalid event at index %s: %s", i, event)
-                continue
-
+        event_options = _event_options(self.events)
         if not event_options:
             _LOGGER.error("No valid events found for selection")
-            return self.async_show_form(
-                step_id="init",
-                data_schema=vol.Schema({
-                    vol.Required("action"): vol.In(["edit"])
-                }),
-                errors={"base": "no_events"}
-            )
+            return self._show_init_form({"base": "no_events"})
 
+        errors = {}
         if user_input is not None:
-            if "event" not in user_input or user_input["event"] not in event_options:
+            if user_input.get("event") not in event_options:
                 _LOGGER.warning("No valid event selected in user_input: %s", user_input)
-                return self.async_show_form(
-                    step_id="select_event",
-                    data_schema=vol.Schema({
-                        vol.Required("event"): vol.In(event_options),
-                    }),
-                    errors={"event": "event_required"}
-                )
-
-            event_index = int(user_input["event"])
-            _LOGGER.info("Selected event index: %s for editing", event_index)
-            self._event_type = self.events[event_index]["type"]
-            return await self.async_step_edit_event_type({"event_index": event_index})
+                errors["event"] = "event_required"
+            else:
+                self._event_index = int(user_input["event"])
+                _LOGGER.info("Selected event index: %s for editing", self._event_index)
+                self._event_type = self.events[self._event_index]["type"]
+                return await self.async_step_edit_event_type()
 
         _LOGGER.info("Showing form for step 'select_event' with %d options", len(event_options))
         return self.async_show_form(
             step_id="select_event",
             data_schema=vol.Schema({
                 vol.Required("event"): vol.In(event_options),
-            })
+            }),
+            errors=errors
         )
 
     async def async_step_edit_event_type(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle selecting the event type for editing an event."""
         _LOGGER.debug("async_step_edit_event_type called with user_input: %s", user_input)
-        event_index = user_input.get("event_index", 0)
-        if user_input is not None and "type" in user_input:
+        if user_input is not None:
             self._event_type = user_input["type"]
             _LOGGER.info("Selected event type for edit: %s", self._event_type)
-            user_input["event_index"] = event_index
-            return await self.async_step_edit_event(user_input)
-
-        event = self.events[event_index]
-        event_type_options = {
-            "birthday": "Anniversaire",
-            "anniversary": "Anniversaire de mariage",
-            "memorial": "Mémorial",
-            "promotion": "Promotion",
-            "special_event": "Événement spécial",
-            "retirement": "Retraite"
-        }
+            return await self.async_step_edit_event()
 
+        event = self.events[self._event_index]
         return self.async_show_form(
             step_id="edit_event_type",
             data_schema=vol.Schema({
-                vol.Required("type", description="Type d'événement", default=event["type"]): vol.In(event_type_options),
+                vol.Required("type", description="Type d'événement", default=event["type"]): vol.In(EVENT_TYPE_OPTIONS),
             }),
             description_placeholders={"date_format": DATE_FORMAT}
         )
 
     async def async_step_edit_event(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
-        """Handle editing an event."""
+        """Handle editing an event, then edit another one or save the changes."""
         _LOGGER.debug("async_step_edit_event called with user_input: %s", user_input)
         errors = {}
-        event_index = user_input.get("event_index", 0)
+        event_index = self._event_index
         event = self.events[event_index]
         _LOGGER.debug("Editing event at index %s: %s", event_index, event)
 
         if user_input is not None:
             _LOGGER.debug("Processing edit event: %s", user_input)
-            if self._event_type == "retirement":
-                if not re.match(r"^\d{2}/\d{2}/\d{4}$", user_input["start_date"]):
-                    errors["start_date"] = "invalid_date_format"
-                    _LOGGER.error("Invalid start date format for edit: %s", user_input["start_date"])
-                if not errors:
-                    try:
-                        day, month, year = map(int, user_input["start_date"].split('/'))
-                        date(year, month, day)
-                    except (ValueError, TypeError) as e:
-                        errors["start_date"] = "invalid_date_format"
-                        _LOGGER.error("Date validation failed for edit start_date %s: %s", user_input["start_date"], e)
-            else:
-                if not re.match(r"^\d{2}/\d{2}/\d{4}$", user_input["date"]):
-                    errors["date"] = "invalid_date_format"
-                    _LOGGER.error("Invalid date format for edit: %s", user_input["date"])
-                elif self._event_type == "memorial" and user_input.get("death_date"):
-                    if not re.match(r"^\d{2}/\d{2}/\d{4}$", user_input["death_date"]):
-                        errors["death_date"] = "invalid_memorial_date"
-                        _LOGGER.error("Invalid death date format for edit: %s", user_input["death_date"])
-                    else:
-                        try:
-                            day, month, year = map(int, user_input["death_date"].split('/'))
-                            date(year, month, day)
-                        except (ValueError, TypeError) as e:
-                            errors["death_date"] = "invalid_memorial_date"
-                            _LOGGER.error("Date validation failed for edit death_date %s: %s", user_input["death_date"], e)
-                if not errors:
-                    try:
-                        day, month, year = map(int, user_input["date"].split('/'))
-                        date(year, month, day)
-                    except (ValueError, TypeError) as e:
-                        errors["date"] = "invalid_date_format"
-                        _LOGGER.error("Date validation failed for edit date %s: %s", user_input["date"], e)
+            others = self.events[:event_index] + self.events[event_index + 1:]
+            errors = _validate_new_event(self._event_type, user_input, others)
 
             if not errors:
-                _LOGGER.info("Updating event at index %s: %s", event_index, user_input)
-                event_data = {
-                    "name": user_input["name"],
-                    "first_name": user_input.get("first_name", ""),
-                    "type": self._event_type
-                }
-                if self._event_type == "retirement":
-                    event_data["start_date"] = user_input["start_date"]
-                    event_data["is_penible"] = user_input.get("is_penible", False)
-                    event_data["career_type"] = user_input.get("career_type", "normale")
-                elif self._event_type == "memorial" and user_input.get("death_date"):
-                    event_data["death_date"] = user_input["death_date"]
-                    event_data["date"] = user_input["date"]
-                else:
-                    event_data["date"] = user_input["date"]
-                self.events[event_index] = event_data
-                _LOGGER.info("Updated events list: %s", self.events)
+                _LOGGER.info("Updating event at index %s", event_index)
+                self.events[event_index] = _build_event(self._event_type, user_input)
+                if user_input.get("edit_another"):
+                    return await self.async_step_select_event()
                 try:
-                    self.hass.config_entries.async_update_entry(
-                        self.hass.config_entries.async_get_entry(self._config_entry_id),
-                        title=_generate_entry_title(self.events),
-                        options={"events": self.events}
-                    )
-                    await self.hass.config_entries.async_reload(self._config_entry_id)
-                    _LOGGER.info("Reloaded config entry %s after editing event", self._config_entry_id)
-                    return self.async_create_entry(
-                        title=_generate_entry_title(self.events),
-                        data={},
-                        options={"events": self.events}
-                    )
+                    return await self._async_commit()
                 except Exception as e:
                     _LOGGER.error("Failed to update entry after editing event: %s", e)
                     errors["base"] = "update_failed"
 
-        if self._event_type == "retirement":
-            career_type_options = {
-                "longue": "Carrière longue (début avant 18 ans)",
-                "normale": "Carrière normale (début après 18 ans)"
-            }
-            schema = {
-                vol.Required("name", description="Nom de l'événement ou de la personne", default=event.get("name", "")): str,
-                vol.Optional("first_name", description="Prénom (optionnel)", default=event.get("first_name", "")): str,
-                vol.Required("start_date", description=f"Date de début du travail (format: {DATE_FORMAT})", default=event.get("start_date", "")): str,
-                vol.Optional("is_penible", description="Travaux pénibles (réduit les années pour la médaille)", default=event.get("is_penible", False)): bool,
-                vol.Required("career_type", description="Type de carrière", default=event.get("career_type", "normale")): vol.In(career_type_options)
-            }
-        else:
-            date_label = "Date de naissance" if self._event_type == "memorial" else "Date"
-            schema = {
-                vol.Required("name", description="Nom de l'événement ou de la personne", default=event.get("name", "")): str,
-                vol.Optional("first_name", description="Prénom (optionnel)", default=event.get("first_name", "")): str,
-                vol.Required("date", description=f"{date_label} (format: {DATE_FORMAT})", default=event.get("date", "")): str,
-            }
-            if self._event_type == "memorial":
-                schema[vol.Optional("death_date", description=f"Date de décès (format: {DATE_FORMAT})", default=event.get("death_date", ""))] = str
-
         _LOGGER.info("Showing form for step 'edit_event' with event_type: %s", self._event_type)
         return self.async_show_form(
             step_id="edit_event",
-            data_schema=vol.Schema(schema),
+            data_schema=_event_schema(self._event_type, user_input or event, another="edit_another"),
             errors=errors,
             description_placeholders={"date_format": DATE_FORMAT}
         )
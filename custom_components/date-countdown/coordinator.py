@@ -0,0 +1,441 @@
+"""Data update coordinator for Date Countdown."""
+import asyncio
+import heapq
+import logging
+import time
+from operator import is_
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .batch import BatchEngine, create_batch_engine, numpy_available, numpy_loaded
+from .const import (
+    BATCH_ENGINE_MIN_EVENTS,
+    CONF_OFFLOAD_THRESHOLD,
+    DEFAULT_OFFLOAD_THRESHOLD,
+    DOMAIN,
+    OFFLOAD_SHARD_SIZE,
+    SIGNAL_EVENTS_UPDATED,
+)
+from .lookup import get_age_category, get_wedding_type
+from .model import CountdownEvent, parse_events
+from .occurrences import next_occurrence
+from .stats import EntryStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def next_local_midnight(now: datetime) -> datetime:
+    """Return the start of the local day following the given instant.
+
+    The local calendar date is taken in ``dt_util.DEFAULT_TIME_ZONE`` and the
+    next day is localized on its own, so the result stays correct across DST
+    transitions (23 or 25 hour days) and after a time zone change.
+    """
+    tomorrow = dt_util.as_local(now).date() + timedelta(days=1)
+    return dt_util.start_of_local_day(tomorrow)
+
+
+def get_coordinators(hass: HomeAssistant) -> List["DateCountdownCoordinator"]:
+    """Return the coordinators of every loaded config entry."""
+    return [
+        entry_data["coordinator"]
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if isinstance(entry_data, dict) and "coordinator" in entry_data
+    ]
+
+
+def _empty_state() -> Dict[str, Any]:
+    """Return the state of an event that could not be computed."""
+    return {
+        "state": None,
+        "years": None,
+        "wedding_type": None,
+        "age_if_alive": None,
+        "years_since_death": None,
+        "age_category": None,
+        "icon": None,
+        "years_remaining": None,
+        "years_retired": None,
+        "work_medal": None,
+        "age_at_death": None,
+        "next_date": None,
+    }
+
+
+def compute_event_state(event: CountdownEvent, today: date) -> Dict[str, Any]:
+    """Compute the countdown values of a single event for the given day."""
+    result = _empty_state()
+
+    if event.event_type == "retirement":
+        start_date = event.event_date
+
+        # Calculer les années travaillées
+        years = today.year - start_date.year
+        if (today.month, today.day) < (start_date.month, start_date.day):
+            years -= 1
+        result["years"] = years
+
+        retirement_date = event.retirement_date
+        if retirement_date is None:
+            return result
+        result["next_date"] = retirement_date
+
+        # Gérer retraite passée ou future
+        if retirement_date <= today:
+            result["state"] = 0
+            result["years_remaining"] = 0
+            years_retired = today.year - retirement_date.year
+            if (today.month, today.day) < (retirement_date.month, retirement_date.day):
+                years_retired -= 1
+            result["years_retired"] = years_retired
+        else:
+            result["state"] = (retirement_date - today).days
+            years_remaining = retirement_date.year - today.year
+            if (today.month, today.day) > (retirement_date.month, retirement_date.day):
+                years_remaining -= 1
+            result["years_remaining"] = years_remaining
+
+        # Déterminer la médaille du travail
+        result["work_medal"] = event.medal_table.resolve(years)
+        return result
+
+    event_date = event.event_date
+    next_event = next_occurrence(event_date, today)
+
+    result["next_date"] = next_event
+    result["state"] = (next_event - today).days
+    result["years"] = next_event.year - event_date.year
+
+    if event.event_type == "anniversary":
+        result["wedding_type"] = get_wedding_type(result["years"])
+
+    if event.event_type == "memorial":
+        age_if_alive = today.year - event_date.year
+        if (today.month, today.day) < (event_date.month, event_date.day):
+            age_if_alive -= 1
+        result["age_if_alive"] = age_if_alive
+        death_date = event.death_date
+        if death_date:
+            years_since_death = today.year - death_date.year
+            if (today.month, today.day) < (death_date.month, death_date.day):
+                years_since_death -= 1
+            result["years_since_death"] = years_since_death
+            age_at_death = death_date.year - event_date.year
+            if (death_date.month, death_date.day) < (event_date.month, event_date.day):
+                age_at_death -= 1
+            result["age_at_death"] = age_at_death
+
+    if event.event_type == "birthday":
+        category, icon = get_age_category(result["years"])
+        if category:
+            result["age_category"] = category
+            result["icon"] = icon
+
+    return result
+
+
+def _compute_state(event: CountdownEvent, today: date) -> Dict[str, Any]:
+    """Compute the state of an event, or an empty state on error."""
+    try:
+        return compute_event_state(event, today)
+    except ValueError as e:
+        _LOGGER.error("Failed to compute state for event %s: %s", event.unique_id, e)
+        return _empty_state()
+
+
+class Shard(NamedTuple):
+    """Events computed together, with their batch engine when they are numerous enough."""
+
+    events: Sequence[CountdownEvent]
+    engine: Optional[BatchEngine]
+
+
+def build_shards(
+    events: Sequence[CountdownEvent], shard_size: int, old_shards: Sequence[Shard] = ()
+) -> List[Shard]:
+    """Split the events into shards of at most ``shard_size`` events.
+
+    An old shard holding the very same event objects at the same position is
+    kept with its batch engine. New shards have no batch engine until
+    ``build_batch_engines`` runs in the executor.
+    """
+    shards = []
+    for position, start in enumerate(range(0, len(events), shard_size)):
+        chunk = events[start:start + shard_size]
+        old = old_shards[position] if position < len(old_shards) else None
+        if old is not None and len(old.events) == len(chunk) and all(map(is_, old.events, chunk)):
+            shards.append(old)
+        else:
+            shards.append(Shard(chunk, None))
+    return shards
+
+
+def needs_batch_engine(shard: Shard) -> bool:
+    """Return whether a shard is large enough for a batch engine but has none yet."""
+    return shard.engine is None and len(shard.events) >= BATCH_ENGINE_MIN_EVENTS
+
+
+def build_batch_engines(shards: Sequence[Shard]) -> List[Shard]:
+    """Give a batch engine to the shards that need one. Builds NumPy arrays, so runs in the executor."""
+    return [
+        Shard(shard.events, create_batch_engine(shard.events, BATCH_ENGINE_MIN_EVENTS))
+        if needs_batch_engine(shard) else shard
+        for shard in shards
+    ]
+
+
+def compute_shard(shard: Shard, today: date) -> Dict[str, Dict[str, Any]]:
+    """Compute the states of the events of a shard.
+
+    Only reads the shard, so several shards can be computed at once in the
+    executor. Falls back to the event loop if the batch engine fails.
+    """
+    if shard.engine is not None:
+        try:
+            return shard.engine.compute(today)
+        except (ValueError, OverflowError) as e:
+            _LOGGER.warning("Batch computation failed, computing %d events one by one: %s", len(shard.events), e)
+    return {event.unique_id: _compute_state(event, today) for event in shard.events}
+
+
+class DateCountdownCoordinator(DataUpdateCoordinator[Dict[str, Dict[str, Any]]]):
+    """Compute the state of every event of a config entry in a single pass.
+
+    Every computed value only depends on the local date, so the coordinator
+    does not poll: it refreshes once at each local midnight and whenever the
+    Home Assistant time zone changes.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, raw_events: Iterable[Dict[str, Any]]) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{entry.entry_id}",
+            update_interval=None,
+        )
+        self.entry = entry
+        self.events: List[CountdownEvent] = parse_events(raw_events)
+        self.events_by_id: Dict[str, CountdownEvent] = {event.unique_id: event for event in self.events}
+        self.offload_threshold: int = entry.options.get(CONF_OFFLOAD_THRESHOLD, DEFAULT_OFFLOAD_THRESHOLD)
+        self.shards: List[Shard] = build_shards(self.events, self._shard_size)
+        # Par type d'événement, (jours restants, unique_id) triés : un tas min déjà ordonné
+        self.upcoming: Dict[str, List[Tuple[int, str]]] = {}
+        self._unsub_midnight: Optional[Callable[[], None]] = None
+        self.stats = EntryStats()
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first computation and the midnight-aligned refreshes.
+
+        The first computation waits until Home Assistant has started, so the
+        entries do not compete with the rest of the startup.
+        """
+        self.entry.async_on_unload(async_at_started(self.hass, self._async_handle_started))
+        self._schedule_midnight_refresh()
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._handle_core_config_update)
+        )
+        self.entry.async_on_unload(self._cancel_midnight_refresh)
+
+    async def _async_handle_started(self, _hass: HomeAssistant) -> None:
+        """Compute all events for the first time."""
+        await self.async_refresh()
+
+    @callback
+    def _schedule_midnight_refresh(self) -> None:
+        """Schedule the next refresh at the next local midnight."""
+        self._cancel_midnight_refresh()
+        next_refresh = next_local_midnight(dt_util.utcnow())
+        self._unsub_midnight = async_track_point_in_utc_time(
+            self.hass, self._handle_midnight, dt_util.as_utc(next_refresh)
+        )
+        _LOGGER.debug("Next refresh of entry %s scheduled at %s", self.entry.entry_id, next_refresh)
+
+    @callback
+    def _cancel_midnight_refresh(self) -> None:
+        """Cancel the scheduled midnight refresh."""
+        if self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
+
+    async def _handle_midnight(self, _now: datetime) -> None:
+        """Recompute all events when the local date changes."""
+        self._unsub_midnight = None
+        self._schedule_midnight_refresh()
+        await self.async_refresh()
+
+    async def _handle_core_config_update(self, event: Event) -> None:
+        """Reschedule and recompute when the time zone may have changed."""
+        if "time_zone" not in event.data:
+            return
+        self._schedule_midnight_refresh()
+        await self.async_refresh()
+
+    @property
+    def device_info(self) -> Dict[str, Any]:
+        """Return the device grouping the entities of the entry."""
+        return {
+            "identifiers": {(DOMAIN, self.entry.entry_id)},
+            "name": "Date Countdown",
+            "manufacturer": "XAV59213"
+        }
+
+    @property
+    def offloaded(self) -> bool:
+        """Return whether the full recomputation runs in the executor."""
+        return len(self.events) >= self.offload_threshold
+
+    @property
+    def _shard_size(self) -> int:
+        """Return the number of events per shard, all of them when computed inline."""
+        return OFFLOAD_SHARD_SIZE if self.offloaded else max(len(self.events), 1)
+
+    async def async_prepare_batch_engine(self) -> None:
+        """Build the batch engines of the shards that need one, in the executor.
+
+        NumPy is imported in the import executor the first time an entry is
+        large enough, never on the event loop. The engines are dropped if the
+        events were edited meanwhile: the edit schedules its own build.
+        """
+        if not any(needs_batch_engine(shard) for shard in self.shards):
+            return
+        if not numpy_loaded() and not await self.hass.async_add_import_executor_job(numpy_available):
+            return
+        shards = self.shards
+        built = await self.hass.async_add_executor_job(build_batch_engines, shards)
+        if self.shards is shards:
+            self.shards = built
+
+    async def _async_update_data(self) -> Dict[str, Dict[str, Any]]:
+        """Compute the countdown values of all events of the entry.
+
+        Large entries are computed shard by shard in the executor, so the
+        event loop keeps running during the daily recomputation.
+        """
+        started = time.perf_counter()
+        today = dt_util.now().date()
+        events = self.events
+        shards = self.shards
+        if not self.offloaded:
+            data, upcoming = self._merge_shards(events, [compute_shard(shard, today) for shard in shards], today)
+        else:
+            results = await asyncio.gather(
+                *(self.hass.async_add_executor_job(compute_shard, shard, today) for shard in shards)
+            )
+            data, upcoming = await self.hass.async_add_executor_job(self._merge_shards, events, results, today)
+            if self.events is not events:
+                # Les événements ont changé pendant le calcul, leurs états sont déjà à jour
+                return self.data
+        self.upcoming = upcoming
+        self.stats.record_refresh(time.perf_counter() - started, len(shards) if self.offloaded else 0)
+        _LOGGER.debug(
+            "Computed %d event states for entry %s in %d shard(s)", len(data), self.entry.entry_id, len(shards)
+        )
+        return data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Push the data to the entities, timing the whole round."""
+        started = time.perf_counter()
+        super().async_update_listeners()
+        self.stats.record_listeners(time.perf_counter() - started)
+
+    @callback
+    def async_update_events(self, raw_events: Iterable[Dict[str, Any]]) -> None:
+        """Apply edited events without reloading the entry.
+
+        Only the states of the added and modified events are computed. The
+        platforms are then told which entities to add, remove or update
+        through ``SIGNAL_EVENTS_UPDATED``. When a large entry gets more new
+        states than a shard, they are left to a refresh in the executor.
+        Only the shards holding changed events are rebuilt, and their batch
+        engines are built in the executor.
+        """
+        old_events = self.events_by_id
+        # Les événements inchangés gardent leur objet, que les entités comparent par identité
+        events = [
+            old_event if (old_event := old_events.get(event.unique_id)) == event else event
+            for event in parse_events(raw_events)
+        ]
+        events_by_id = {event.unique_id: event for event in events}
+        added = [event for unique_id, event in events_by_id.items() if unique_id not in old_events]
+        removed = [unique_id for unique_id in old_events if unique_id not in events_by_id]
+        updated = [
+            event for unique_id, event in events_by_id.items()
+            if unique_id in old_events and old_events[unique_id] != event
+        ]
+        self.events = events
+        self.events_by_id = events_by_id
+        self.shards = build_shards(events, self._shard_size, self.shards)
+
+        today = dt_util.now().date()
+        old_data = self.data or {}
+        offload = self.offloaded and len(added) + len(updated) >= OFFLOAD_SHARD_SIZE
+        data: Dict[str, Dict[str, Any]] = {}
+        for event in events:
+            state = old_data.get(event.unique_id)
+            if state is None or old_events.get(event.unique_id) != event:
+                if offload:
+                    continue
+                state = _compute_state(event, today)
+            data[event.unique_id] = state
+        self.upcoming = self._build_upcoming(events, data, today)
+        self.async_set_updated_data(data)
+        if offload:
+            self.hass.async_create_task(self.async_refresh())
+        if any(needs_batch_engine(shard) for shard in self.shards):
+            self.hass.async_create_task(self.async_prepare_batch_engine())
+
+        _LOGGER.debug(
+            "Events of entry %s updated: %d added, %d removed, %d modified",
+            self.entry.entry_id, len(added), len(removed), len(updated),
+        )
+        async_dispatcher_send(
+            self.hass, SIGNAL_EVENTS_UPDATED.format(self.entry.entry_id), added, removed, updated
+        )
+
+    @classmethod
+    def _merge_shards(
+        cls, events: Sequence[CountdownEvent], results: Iterable[Dict[str, Dict[str, Any]]], today: date
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Tuple[int, str]]]]:
+        """Merge the states computed per shard and order the upcoming occurrences."""
+        data: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            data.update(result)
+        return data, cls._build_upcoming(events, data, today)
+
+    @staticmethod
+    def _build_upcoming(
+        events: Iterable[CountdownEvent], data: Dict[str, Dict[str, Any]], today: date
+    ) -> Dict[str, List[Tuple[int, str]]]:
+        """Order the future occurrences of each event type by days remaining."""
+        upcoming: Dict[str, List[Tuple[int, str]]] = {}
+        for event in events:
+            state = data.get(event.unique_id)
+            # Les retraites déjà atteintes ne sont plus à venir
+            if state is None or state["next_date"] is None or state["next_date"] < today:
+                continue
+            upcoming.setdefault(event.event_type, []).append((state["state"], event.unique_id))
+        for heap in upcoming.values():
+            heap.sort()
+        return upcoming
+
+    def iter_upcoming(self, event_types: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        """Iterate over the upcoming occurrences of the given types, soonest first."""
+        return heapq.merge(*(self.upcoming.get(event_type, []) for event_type in event_types))
+
+    def get_event_state(self, unique_id: str) -> Optional[Dict[str, Any]]:
+        """Return the last computed state of an event."""
+        if not self.data:
+            return None
+        return self.data.get(unique_id)
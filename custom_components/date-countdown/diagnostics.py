@@ -0,0 +1,34 @@
+"""Diagnostics support for Date Countdown."""
+from collections import Counter
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return the diagnostics of a config entry.
+
+    Only counts are reported, never the names or dates of the events.
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        return {"options": dict(entry.options), "loaded": False}
+
+    coordinator = entry_data["coordinator"]
+    store = entry_data["store"]
+    return {
+        "options": dict(entry.options),
+        "loaded": True,
+        "stored_events": len(store.events),
+        "valid_events": len(coordinator.events),
+        "events_by_type": dict(Counter(event.event_type for event in coordinator.events)),
+        "upcoming_by_type": {event_type: len(items) for event_type, items in coordinator.upcoming.items()},
+        "last_update_success": coordinator.last_update_success,
+        "offloaded": coordinator.offloaded,
+        "shards": len(coordinator.shards),
+        "batch_engine_shards": sum(1 for shard in coordinator.shards if shard.engine is not None),
+        "stats": coordinator.stats.as_dict(),
+    }
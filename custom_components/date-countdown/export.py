@@ -0,0 +1,210 @@
+"""Streaming iCalendar export of Date Countdown events."""
+import logging
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .calendar import calendar_name, generate_retirement_summary, occurrence_summary
+from .const import CALENDAR_MAX_YEARS, DOMAIN
+from .coordinator import DateCountdownCoordinator, get_coordinators
+from .model import CountdownEvent
+from .occurrences import merge_occurrences, tagged_occurrences, yearly_rrule
+
+_LOGGER = logging.getLogger(__name__)
+
+# Taille des morceaux envoyés au client
+ICS_CHUNK_SIZE = 64 * 1024
+ICS_MAX_LINE_OCTETS = 75
+
+
+def _escape(text: str) -> str:
+    """Escape an iCalendar text value."""
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets, without splitting UTF-8 characters."""
+    if len(line.encode("utf-8")) <= ICS_MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts: List[str] = []
+    current, size, limit = [], 0, ICS_MAX_LINE_OCTETS
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > limit:
+            parts.append("".join(current))
+            # Les lignes de continuation commencent par une espace
+            current, size, limit = [], 0, ICS_MAX_LINE_OCTETS - 1
+        current.append(char)
+        size += char_size
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_date(day: date) -> str:
+    """Format a date as an iCalendar DATE value."""
+    return day.strftime("%Y%m%d")
+
+
+def _summary(event: CountdownEvent) -> str:
+    """Return the summary of the occurrences of an event."""
+    name = calendar_name(event)
+    if event.event_type == "retirement":
+        return generate_retirement_summary(name, event)
+    return name
+
+
+def _vevent(entry_id: str, event: CountdownEvent, dtstamp: str) -> str:
+    """Return the VEVENT of an event.
+
+    Yearly events are exported once with a recurrence rule, so the output
+    does not grow with the time window. A retirement happens once.
+    """
+    if event.event_type == "retirement":
+        if event.retirement_date is None:
+            return ""
+        start = event.retirement_date
+        rrule = None
+    else:
+        start = event.event_date
+        rrule = yearly_rrule(event.event_date)
+    return _vevent_lines(f"{entry_id}-{event.unique_id}", event, start, _summary(event), rrule, dtstamp)
+
+
+def _occurrence_vevent(
+    entry_id: str, event: CountdownEvent, day: date, years: int, today: date, dtstamp: str
+) -> str:
+    """Return the VEVENT of a single occurrence of an event, titled like the calendar entities."""
+    uid = f"{entry_id}-{event.unique_id}-{_ics_date(day)}"
+    return _vevent_lines(uid, event, day, occurrence_summary(event, years, today), None, dtstamp)
+
+
+def _vevent_lines(
+    uid: str, event: CountdownEvent, start: date, summary: str, rrule: Optional[str], dtstamp: str
+) -> str:
+    """Return a folded VEVENT starting on ``start``."""
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{_escape(f'{uid}@{DOMAIN}')}",
+        f"DTSTAMP:{dtstamp}",
+        f"DTSTART;VALUE=DATE:{_ics_date(start)}",
+        f"DTEND;VALUE=DATE:{_ics_date(start + timedelta(days=1))}",
+    ]
+    if rrule is not None:
+        lines.append(f"RRULE:{rrule}")
+    lines.append(f"SUMMARY:{_escape(summary)}")
+    lines.append(f"DESCRIPTION:{_escape(event.date_str)}")
+    lines.append(f"CATEGORIES:{event.event_type.upper()}")
+    lines.append("TRANSP:TRANSPARENT")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def iter_ics(
+    coordinators: Iterable[DateCountdownCoordinator],
+    now: datetime,
+    window: Optional[Tuple[date, date]] = None,
+) -> Iterator[str]:
+    """Yield an iCalendar document of the events of the coordinators, event by event.
+
+    Without a window, each event is exported once with its recurrence rule.
+    With a window, every occurrence within it is exported on its own, in date
+    order across all entries, and only those occurrences are generated.
+    """
+    coordinators = list(coordinators)
+    dtstamp = dt_util.as_utc(now).strftime("%Y%m%dT%H%M%SZ")
+    yield _fold("BEGIN:VCALENDAR")
+    yield _fold("VERSION:2.0")
+    yield _fold(f"PRODID:-//XAV59213//{DOMAIN}//FR")
+    yield _fold("CALSCALE:GREGORIAN")
+    if len(coordinators) == 1:
+        yield _fold(f"X-WR-CALNAME:{_escape(f'Date Countdown - {coordinators[0].entry.title}')}")
+    if window is not None:
+        start, end = window
+        today = dt_util.as_local(now).date()
+        occurrences = merge_occurrences(
+            tagged_occurrences(coordinator.events, start, end, coordinator.entry.entry_id)
+            for coordinator in coordinators
+        )
+        for day, event, years, entry_id in occurrences:
+            yield _occurrence_vevent(entry_id, event, day, years, today, dtstamp)
+    else:
+        for coordinator in coordinators:
+            entry_id = coordinator.entry.entry_id
+            for event in coordinator.events:
+                vevent = _vevent(entry_id, event, dtstamp)
+                if vevent:
+                    yield vevent
+    yield _fold("END:VCALENDAR")
+
+
+def parse_window(start: Optional[str], end: Optional[str], today: date) -> Optional[Tuple[date, date]]:
+    """Return the export window of the ``start`` and ``end`` query parameters, or None without them.
+
+    ``start`` defaults to today and ``end`` to one year later. The window is
+    limited to CALENDAR_MAX_YEARS years. Raise ValueError on an invalid date.
+    """
+    if start is None and end is None:
+        return None
+    window_start = today if start is None else date.fromisoformat(start)
+    window_end = window_start + timedelta(days=365) if end is None else date.fromisoformat(end)
+    max_end = date(min(window_start.year + CALENDAR_MAX_YEARS, date.max.year), 12, 31)
+    return window_start, min(window_end, max_end)
+
+
+def iter_chunks(parts: Iterable[str], chunk_size: int = ICS_CHUNK_SIZE) -> Iterator[bytes]:
+    """Group the parts of a document into encoded chunks of about ``chunk_size`` bytes."""
+    buffer: List[str] = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+class DateCountdownIcsView(HomeAssistantView):
+    """Export the events of one or all entries as an iCalendar file."""
+
+    url = "/api/date_countdown/calendar.ics"
+    extra_urls = ["/api/date_countdown/calendar/{entry_id}.ics"]
+    name = "api:date_countdown:calendar"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request, entry_id: Optional[str] = None) -> web.StreamResponse:
+        """Stream the iCalendar file."""
+        coordinators = get_coordinators(self.hass)
+        if entry_id is not None:
+            coordinators = [coordinator for coordinator in coordinators if coordinator.entry.entry_id == entry_id]
+            if not coordinators:
+                return web.Response(status=404, text=f"Unknown Date Countdown entry: {entry_id}")
+        now = dt_util.utcnow()
+        try:
+            window = parse_window(request.query.get("start"), request.query.get("end"), dt_util.as_local(now).date())
+        except ValueError:
+            return web.Response(status=400, text="Invalid start or end date, expected YYYY-MM-DD")
+
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/calendar; charset=utf-8",
+                "Content-Disposition": f'attachment; filename="{entry_id or DOMAIN}.ics"',
+            }
+        )
+        await response.prepare(request)
+        chunks = 0
+        for chunk in iter_chunks(iter_ics(coordinators, now, window)):
+            await response.write(chunk)
+            chunks += 1
+        await response.write_eof()
+        _LOGGER.debug("Exported %d entries as iCalendar in %d chunk(s)", len(coordinators), chunks)
+        return response
@@ -0,0 +1,203 @@
+"""Bulk import of events from CSV, JSON and iCalendar files."""
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import EVENT_TYPES
+from .model import event_unique_id, validate_event_dates
+from .storage import async_commit_events, async_get_event_store
+
+_LOGGER = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ["csv", "json", "ics"]
+CAREER_TYPES = ["longue", "normale"]
+TRUE_VALUES = {"1", "true", "yes", "oui", "x"}
+
+# Une ligne du fichier : (numéro de ligne ou d'élément, valeurs brutes)
+Row = Tuple[int, Any]
+
+
+def _read_csv(path: Path) -> Iterator[Row]:
+    """Yield the rows of a CSV file with a header, separated by commas or semicolons."""
+    with path.open(newline="", encoding="utf-8-sig") as file:
+        sample = file.read(4096)
+        file.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.DictReader(file, dialect=dialect)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def _read_json(path: Path) -> Iterator[Row]:
+    """Yield the events of a JSON list, or of the ``events`` list of an object."""
+    with path.open(encoding="utf-8") as file:
+        data = json.load(file)
+    if isinstance(data, dict):
+        data = data.get("events", [])
+    if not isinstance(data, list):
+        raise ValueError("expected a list of events")
+    yield from enumerate(data, start=1)
+
+
+def _unescape_ics(value: str) -> str:
+    """Unescape an iCalendar text value."""
+    return value.replace("\\n", " ").replace("\\N", " ").replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+
+
+def _ics_event(properties: Dict[str, str]) -> Dict[str, Any]:
+    """Map the properties of a VEVENT to the fields of an event.
+
+    The event type is taken from CATEGORIES when it is a Date Countdown type.
+    """
+    dtstart = properties.get("DTSTART", "")[:8]
+    categories = [category.strip().lower() for category in properties.get("CATEGORIES", "").split(",")]
+    event_type = next((category for category in categories if category in EVENT_TYPES), "special_event")
+    event: Dict[str, Any] = {"name": _unescape_ics(properties.get("SUMMARY", "")), "type": event_type}
+    date_key = "start_date" if event_type == "retirement" else "date"
+    event[date_key] = f"{dtstart[6:8]}/{dtstart[4:6]}/{dtstart[0:4]}" if dtstart.isdigit() and len(dtstart) == 8 else dtstart
+    return event
+
+
+def _read_ics(path: Path) -> Iterator[Row]:
+    """Yield the VEVENT components of an iCalendar file, line by line."""
+
+    def _unfolded(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        number, current = 0, None
+        for line_num, line in enumerate(lines, start=1):
+            line = line.rstrip("\r\n")
+            if line[:1] in (" ", "\t") and current is not None:
+                current += line[1:]
+                continue
+            if current is not None:
+                yield number, current
+            number, current = line_num, line
+        if current is not None:
+            yield number, current
+
+    with path.open(encoding="utf-8-sig") as file:
+        properties: Optional[Dict[str, str]] = None
+        start = 0
+        for line_num, line in _unfolded(file):
+            if line == "BEGIN:VEVENT":
+                properties, start = {}, line_num
+            elif line == "END:VEVENT" and properties is not None:
+                yield start, _ics_event(properties)
+                properties = None
+            elif properties is not None and ":" in line:
+                name, value = line.split(":", 1)
+                properties.setdefault(name.split(";", 1)[0].upper(), value)
+
+
+READERS = {"csv": _read_csv, "json": _read_json, "ics": _read_ics}
+
+
+def _as_bool(value: Any) -> bool:
+    """Interpret a boolean cell of an import file."""
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+def build_event(row: Any) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+    """Validate a row and build the raw event stored for it.
+
+    Return the event, or ``None`` with the errors keyed by field.
+    """
+    if not isinstance(row, dict):
+        return None, {"base": "invalid_row"}
+    values = {key: value.strip() if isinstance(value, str) else value for key, value in row.items() if key}
+    errors: Dict[str, str] = {}
+    # Un nom non textuel, par exemple un nombre en JSON, ne peut pas former d'identifiant
+    if not values.get("name"):
+        errors["name"] = "missing_name"
+    elif not isinstance(values["name"], str):
+        errors["name"] = "invalid_name"
+    if values.get("first_name") and not isinstance(values["first_name"], str):
+        errors["first_name"] = "invalid_name"
+    event_type = values.get("type")
+    if event_type not in EVENT_TYPES:
+        errors["type"] = "invalid_type"
+        return None, errors
+    errors.update(validate_event_dates(event_type, values))
+    career_type = values.get("career_type") or "normale"
+    if event_type == "retirement" and career_type not in CAREER_TYPES:
+        errors["career_type"] = "invalid_career_type"
+    if errors:
+        return None, errors
+
+    event = {"name": values["name"], "first_name": values.get("first_name") or "", "type": event_type}
+    if event_type == "retirement":
+        event["start_date"] = values["start_date"]
+        event["is_penible"] = _as_bool(values.get("is_penible"))
+        event["career_type"] = career_type
+    else:
+        event["date"] = values["date"]
+        if event_type == "memorial" and values.get("death_date"):
+            event["death_date"] = values["death_date"]
+    return event, {}
+
+
+def import_events_file(
+    path: str, file_format: str, existing_ids: Set[str]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Read and validate an import file in a single pass.
+
+    Rows are streamed from the file and validated one by one, so only the
+    valid events and the report are kept in memory. Events already in the
+    entry, or repeated in the file, are reported as duplicates.
+    """
+    events: List[Dict[str, Any]] = []
+    errors: List[Dict[str, Any]] = []
+    seen = set(existing_ids)
+    for row_number, row in READERS[file_format](Path(path)):
+        event, row_errors = build_event(row)
+        if event is not None:
+            unique_id = event_unique_id(event)
+            if unique_id in seen:
+                event, row_errors = None, {"base": "duplicate"}
+            else:
+                seen.add(unique_id)
+        if event is None:
+            errors.append({"row": row_number, "errors": row_errors})
+        else:
+            events.append(event)
+    return events, errors
+
+
+async def async_import_events(
+    hass: HomeAssistant, entry: ConfigEntry, path: str, file_format: Optional[str] = None
+) -> Dict[str, Any]:
+    """Import the events of a file into an entry and return the report.
+
+    The file must be in an allowed external directory. All valid events are
+    saved in a single store commit.
+    """
+    file_format = file_format or Path(path).suffix.lower().lstrip(".")
+    if file_format not in IMPORT_FORMATS:
+        raise HomeAssistantError(f"Unsupported import format: {file_format}")
+    if not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Access to {path} is not allowed")
+
+    store = await async_get_event_store(hass, entry)
+    existing_ids = {event_unique_id(event) for event in store.events if "name" in event and "type" in event}
+    try:
+        events, errors = await hass.async_add_executor_job(import_events_file, path, file_format, existing_ids)
+    except (OSError, ValueError, csv.Error) as e:
+        raise HomeAssistantError(f"Failed to read {path}: {e}") from e
+
+    if events:
+        await async_commit_events(hass, entry, [*store.events, *events])
+    _LOGGER.info(
+        "Imported %d event(s) from %s into entry %s, %d row(s) rejected",
+        len(events), path, entry.entry_id, len(errors),
+    )
+    return {"imported": len(events), "errors": errors}
@@ -0,0 +1,194 @@
+"""French label tables of Date Countdown.
+
+The tables are only needed to compute states and summaries, so this module
+is imported on first use by ``lookup`` rather than at Home Assistant startup.
+"""
+
+# Catégorie d'âge et icône des anniversaires, indexées par âge, de 0 à 120 ans
+AGE_CATEGORIES = (
+    ("Mini Big Bang", "mdi:star-shooting"),
+    ("Bébé Fusée", "mdi:rocket"),
+    ("Tornade de Gribouilles", "mdi:draw"),
+    ("Pirate des Bacs à Sable", "mdi:shovel"),
+    ("Ninja des Gâteaux", "mdi:cupcake"),
+    ("Roi des Toboggans", "mdi:slide"),
+    ("Artiste des Stickers", "mdi:sticker"),
+    ("Champion des Roulettes", "mdi:bicycle"),
+    ("Maître des Legos", "mdi:toy-brick"),
+    ("Empereur des Cabanes", "mdi:home-roof"),
+    ("As des Cartes Pokémon", "mdi:pokeball"),
+    ("Pré-Ado TikTokeur", "mdi:cellphone-play"),
+    ("Rebelle des Émojis", "mdi:emoticon-cool"),
+    ("Guru des Memes", "mdi:emoticon-lol"),
+    ("Ninja des Selfies", "mdi:camera"),
+    ("Philosophe des Hashtags", "mdi:pound"),
+    ("Roi des Stories Snapchat", "mdi:snapchat"),
+    ("Visionnaire des Reels", "mdi:instagram"),
+    ("Majeur", "mdi:account-check"),
+    ("Sorcier des Festivals", "mdi:music"),
+    ("Ninja des Apéros", "mdi:glass-cocktail"),
+    ("Maître des Soirées Impro", "mdi:party-popper"),
+    ("Jedi des Group Chats", "mdi:chat"),
+    ("Guru des Playlists Spotify", "mdi:music-note"),
+    ("As des Brunchs", "mdi:food"),
+    ("Super-Héros des To-Do Lists", "mdi:check-all"),
+    ("Rockstar des Dimanches Netflix", "mdi:television-play"),
+    ("Sorcier des Excuses Créatives", "mdi:lightbulb-on"),
+    ("Empereur des Karaokés", "mdi:microphone"),
+    ("Maître des Challenges TikTok", "mdi:cellphone-video"),
+    ("Guru des Brunchs", "mdi:food"),
+    ("Ninja des Réunions Zoom", "mdi:video"),
+    ("Jedi des Spreadsheets", "mdi:table"),
+    ("As des Apéros Vins", "mdi:glass-wine"),
+    ("Super-Héros du Multitasking", "mdi:head-sync"),
+    ("Rockstar des Anniversaires", "mdi:cake"),
+    ("Sorcier des BBQ", "mdi:grill"),
+    ("Maître des Blagues Carambar", "mdi:emoticon-happy"),
+    ("Empereur des Soirées Quiz", "mdi:help-circle"),
+    ("Guru des Astuces Cuisine", "mdi:chef-hat"),
+    ("Ninja des Parents Débordés", "mdi:run-fast"),
+    ("Jedi des Vacances Planifiées", "mdi:airplane"),
+    ("As des Jeux de Société", "mdi:chess-king"),
+    ("Super-Héros des Excuses Épiques", "mdi:lightbulb-on"),
+    ("Rockstar des Réunions Parents-Profs", "mdi:school"),
+    ("Sorcier des Budgets Serrés", "mdi:cash"),
+    ("Maître des Anecdotes Drôles", "mdi:comment-quote"),
+    ("Empereur des Barbecues", "mdi:grill"),
+    ("Guru des Soirées Nostalgie", "mdi:vinyl"),
+    ("Ninja des Projets DIY", "mdi:hammer"),
+    ("Rockstar des Blagues de Papa", "mdi:emoticon-happy"),
+    ("Jedi des Siestes Impromptues", "mdi:sleep"),
+    ("As des Histoires de Jeunesse", "mdi:book-open"),
+    ("Super-Héros des Années 80", "mdi:cassette"),
+    ("Sorcier des Recettes de Grand-Mère", "mdi:pot-mix"),
+    ("Maître des Jeux de Cartes", "mdi:cards"),
+    ("Empereur des Randonnées", "mdi:hiking"),
+    ("Guru des Conseils Sages", "mdi:owl"),
+    ("Ninja des Soirées Tricot", "mdi:yarn"),
+    ("Jedi des Documentaires", "mdi:television-classic"),
+    ("Rockstar des Siestes Épiques", "mdi:sleep"),
+    ("As des Mots Fléchés", "mdi:pencil"),
+    ("Super-Héros des Jardins", "mdi:flower"),
+    ("Sorcier des Histoires Épiques", "mdi:book-open"),
+    ("Maître des Soirées Scrabble", "mdi:alphabetical"),
+    ("Empereur des Balades", "mdi:walk"),
+    ("Guru des Souvenirs", "mdi:image-album"),
+    ("Ninja des Petits-Enfants", "mdi:human-child"),
+    ("Jedi des Anecdotes", "mdi:comment-quote"),
+    ("As des Soirées Bingo", "mdi:slot-machine"),
+    ("Rockstar des Récits d’Antan", "mdi:book-open"),
+    ("Super-Héros des Potagers", "mdi:carrot"),
+    ("Sorcier des Contes", "mdi:book-open"),
+    ("Maître des Puzzles", "mdi:puzzle"),
+    ("Empereur des Souvenirs", "mdi:image-album"),
+    ("Guru des Balancelles", "mdi:seat"),
+    ("Ninja des Histoires", "mdi:comment-quote"),
+    ("Jedi des Siestes", "mdi:sleep"),
+    ("As des Récits Légendaires", "mdi:book-open"),
+    ("Rockstar des Souvenirs", "mdi:image-album"),
+    ("Sage des Anecdotes Épiques", "mdi:owl"),
+    ("Super-Héros des Récits", "mdi:book-open"),
+    ("Sorcier des Mémoires", "mdi:book-open"),
+    ("Maître des Histoires", "mdi:comment-quote"),
+    ("Empereur des Légendes", "mdi:medal"),
+    ("Guru des Contes Épiques", "mdi:book-open"),
+    ("Ninja des Souvenirs", "mdi:image-album"),
+    ("Jedi des Récits", "mdi:comment-quote"),
+    ("As des Anecdotes", "mdi:book-open"),
+    ("Rockstar des Mémoires", "mdi:image-album"),
+    ("Sage des Légendes", "mdi:owl"),
+    ("Super-Héros des Contes", "mdi:book-open"),
+    ("Sorcier des Souvenirs", "mdi:image-album"),
+    ("Maître des Récits Épiques", "mdi:comment-quote"),
+    ("Empereur des Mémoires", "mdi:medal"),
+    ("Guru des Histoires", "mdi:book-open"),
+    ("Ninja des Légendes", "mdi:run-fast"),
+    ("Jedi des Anecdotes", "mdi:comment-quote"),
+    ("As des Contes", "mdi:book-open"),
+    ("Rockstar des Souvenirs", "mdi:image-album"),
+    ("Légende Cosmique", "mdi:star-circle"),
+    ("Super-Héros Intergalactique", "mdi:rocket"),
+    ("Sorcier des Étoiles", "mdi:star"),
+    ("Maître des Constellations", "mdi:star-circle"),
+    ("Empereur des Galaxies", "mdi:orbit"),
+    ("Guru des Univers", "mdi:universe"),
+    ("Ninja des Comètes", "mdi:meteor"),
+    ("Jedi des Astres", "mdi:star"),
+    ("As des Nébuleuses", "mdi:cloud-circle"),
+    ("Rockstar des Étoiles", "mdi:star-shooting"),
+    ("Sage des Voies Lactées", "mdi:orbit"),
+    ("Super-Héros des Supernovas", "mdi:star-shooting"),
+    ("Sorcier des Pulsars", "mdi:pulse"),
+    ("Maître des Quasars", "mdi:radiobox-marked"),
+    ("Empereur des Trou Noirs", "mdi:circle-off"),
+    ("Guru des Météores", "mdi:meteor"),
+    ("Ninja des Aurores", "mdi:weather-sunset"),
+    ("Jedi des Éclipses", "mdi:moon-waning-crescent"),
+    ("As des Novas", "mdi:star-circle"),
+    ("Rockstar des Galaxies", "mdi:orbit"),
+    ("Héros Intergalactique", "mdi:medal"),
+)
+
+# Intitulés des noces par années de mariage
+WEDDING_ANNIVERSARIES = {
+    1: "Noces de Coton",
+    2: "Noces de Cuir",
+    3: "Noces de Froment",
+    4: "Noces de Cire",
+    5: "Noces de Bois",
+    6: "Noces de Chypre",
+    7: "Noces de Laine",
+    8: "Noces de Coquelicot",
+    9: "Noces de Faïence",
+    10: "Noces d'Étain",
+    11: "Noces de Corail",
+    12: "Noces de Soie",
+    13: "Noces de Muguet",
+    14: "Noces de Plomb",
+    15: "Noces de Cristal",
+    16: "Noces de Saphir",
+    17: "Noces de Rose",
+    18: "Noces de Turquoise",
+    19: "Noces de Cretonne",
+    20: "Noces de Porcelaine",
+    21: "Noces d'Opale",
+    22: "Noces de Bronze",
+    23: "Noces de Béryl",
+    24: "Noces de Satin",
+    25: "Noces d'Argent",
+    26: "Noces de Jade",
+    27: "Noces d'Acajou",
+    28: "Noces de Nickel",
+    29: "Noces de Velours",
+    30: "Noces de Perle",
+    31: "Noces de Basane",
+    32: "Noces de Cuivre",
+    33: "Noces de Porphyre",
+    34: "Noces d'Ambre",
+    35: "Noces de Rubis",
+    36: "Noces de Mousseline",
+    37: "Noces de Papier",
+    38: "Noces de Mercure",
+    39: "Noces de Crêpe",
+    40: "Noces d'Émeraude",
+    41: "Noces de Fer",
+    42: "Noces de Nacre",
+    43: "Noces de Flanelle",
+    44: "Noces de Topaze",
+    45: "Noces de Vermeil",
+    46: "Noces de Lavande",
+    47: "Noces de Cachemire",
+    48: "Noces d'Améthyste",
+    49: "Noces de Cèdre",
+    50: "Noces d'Or",
+    51: "Noces de Camélia",
+    52: "Noces de Tourmaline",
+    53: "Noces de Merisier",
+    54: "Noces de Zibeline",
+    55: "Noces d'Orchidée",
+    56: "Noces de Lapis-Lazuli",
+    57: "Noces d'Azurite",
+    58: "Noces d'Érable",
+    59: "Noces de Vison",
+    60: "Noces de Diamant",
+}
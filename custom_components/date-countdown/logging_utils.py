@@ -0,0 +1,36 @@
+"""Logging helpers keeping diagnostics out of the Date Countdown hot paths."""
+import logging
+import time
+from typing import Any, Dict, Hashable
+
+
+class RateLimitedLogger:
+    """Emit a debug record at most once per interval for each key.
+
+    Records are dropped before any formatting when debug logging is disabled.
+    When a record is emitted, the number of records suppressed for the same key
+    since the previous one is appended to it.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float = 60.0) -> None:
+        """Initialize the rate-limited logger."""
+        self._logger = logger
+        self._interval = interval
+        self._last_emit: Dict[Hashable, float] = {}
+        self._suppressed: Dict[Hashable, int] = {}
+
+    def debug(self, key: Hashable, msg: str, *args: Any) -> None:
+        """Log a debug record unless one was logged for the key recently."""
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        now = time.monotonic()
+        last_emit = self._last_emit.get(key)
+        if last_emit is not None and now - last_emit < self._interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return
+        self._last_emit[key] = now
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            self._logger.debug(f"{msg} (%d similar messages suppressed)", *args, suppressed)
+        else:
+            self._logger.debug(msg, *args)
@@ -0,0 +1,61 @@
+"""Precomputed lookup tables for Date Countdown."""
+from bisect import bisect_right
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .const import WORK_MEDAL_LEVELS, WORK_MEDAL_PENIBLE_LEVELS
+
+DEFAULT_AGE_ICON = "mdi:cake"
+
+# Catégorie et icône retournées pour un âge hors des tranches connues
+DEFAULT_AGE_CATEGORY: Tuple[Optional[str], str] = (None, DEFAULT_AGE_ICON)
+
+# Tables de labels.py, importées au premier appel plutôt qu'au démarrage de Home Assistant
+_age_categories: Optional[Tuple[Tuple[str, str], ...]] = None
+_wedding_anniversaries: Optional[Dict[int, str]] = None
+
+
+def _load_labels() -> None:
+    """Import the label tables."""
+    global _age_categories, _wedding_anniversaries
+    from .labels import AGE_CATEGORIES, WEDDING_ANNIVERSARIES
+
+    _age_categories = AGE_CATEGORIES
+    _wedding_anniversaries = WEDDING_ANNIVERSARIES
+
+
+def get_age_category(age: int) -> Tuple[Optional[str], str]:
+    """Return the (category, icon) pair for an age."""
+    if _age_categories is None:
+        _load_labels()
+    if 0 <= age < len(_age_categories):
+        return _age_categories[age]
+    return DEFAULT_AGE_CATEGORY
+
+
+def get_wedding_type(years: int) -> Optional[str]:
+    """Return the name of the wedding anniversary after the given years of marriage."""
+    if _wedding_anniversaries is None:
+        _load_labels()
+    return _wedding_anniversaries.get(years)
+
+
+class MedalTable(NamedTuple):
+    """Work medal levels as sorted threshold and label arrays."""
+
+    thresholds: Tuple[int, ...]
+    labels: Tuple[str, ...]
+
+    def resolve(self, years_worked: int) -> Optional[str]:
+        """Return the highest medal reached after the given years worked."""
+        index = bisect_right(self.thresholds, years_worked)
+        return self.labels[index - 1] if index else None
+
+
+def _build_medal_table(levels: Dict[int, str]) -> MedalTable:
+    """Sort a medal level mapping into a MedalTable."""
+    thresholds = tuple(sorted(levels))
+    return MedalTable(thresholds, tuple(levels[years] for years in thresholds))
+
+
+WORK_MEDAL_TABLE = _build_medal_table(WORK_MEDAL_LEVELS)
+WORK_MEDAL_PENIBLE_TABLE = _build_medal_table(WORK_MEDAL_PENIBLE_LEVELS)
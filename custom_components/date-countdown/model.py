@@ -0,0 +1,181 @@
+"""Parsed event model for Date Countdown."""
+import logging
+import re
+import sys
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from .const import EVENT_TYPES
+from .lookup import WORK_MEDAL_PENIBLE_TABLE, WORK_MEDAL_TABLE, MedalTable
+from .occurrences import occurrence_in_year
+
+_LOGGER = logging.getLogger(__name__)
+
+# Années entre le début du travail et la retraite, selon le type de carrière
+YEARS_TO_RETIREMENT = {
+    "longue": 60 - 17,  # Carrière longue : début à 17 ans, retraite à 60 ans
+    "normale": 64 - 19,  # Carrière normale : début à 19 ans, retraite à 64 ans
+}
+
+
+DATE_PATTERN = re.compile(r"^\d{2}/\d{2}/\d{4}$")
+
+
+def parse_date(date_str: str) -> date:
+    """Parse a date string in DD/MM/YYYY format."""
+    day, month, year = map(int, date_str.split('/'))
+    return date(year, month, day)
+
+
+def is_valid_date(value: Any) -> bool:
+    """Return whether a value is an existing date in DD/MM/YYYY format."""
+    if not isinstance(value, str) or not DATE_PATTERN.match(value):
+        return False
+    try:
+        parse_date(value)
+    except ValueError:
+        return False
+    return True
+
+
+def validate_event_dates(event_type: str, values: Dict[str, Any]) -> Dict[str, str]:
+    """Return the errors of the dates of an event, keyed by field.
+
+    These are the rules of the config and options flows: the dates must be
+    existing DD/MM/YYYY dates and the death date of a memorial is optional.
+    """
+    errors = {}
+    if event_type == "retirement":
+        if not is_valid_date(values.get("start_date")):
+            errors["start_date"] = "invalid_date_format"
+        return errors
+    if not is_valid_date(values.get("date")):
+        errors["date"] = "invalid_date_format"
+    if event_type == "memorial" and values.get("death_date") and not is_valid_date(values["death_date"]):
+        errors["death_date"] = "invalid_memorial_date"
+    return errors
+
+
+def event_unique_id(event: Dict[str, Any]) -> str:
+    """Return the unique id shared by the sensor and calendar of an event."""
+    unique_id_base = f"{event['type']}_{event['name'].lower().replace(' ', '_')}"
+    unique_id_date = (event.get("start_date") or event.get("date") or "").replace('/', '')
+    return f"{unique_id_base}_{unique_id_date}"
+
+
+def generate_entry_title(events: list) -> str:
+    """Generate a title for the config entry based on the list of events."""
+    if not events:
+        return "Compte à rebours d'événements (vide)"
+    event_type_labels = {
+        "birthday": "Anniversaire",
+        "anniversary": "Anniversaire de mariage",
+        "memorial": "Mémorial",
+        "promotion": "Promotion",
+        "special_event": "Événement spécial",
+        "retirement": "Retraite"
+    }
+    event_names = []
+    for event in events[:2]:
+        prefix = f"{event.get('first_name', '')} {event['name']}".strip()
+        event_type_name = event_type_labels.get(event["type"], event["type"])
+        event_names.append(f"{prefix} - {event_type_name}")
+    title = ", ".join(event_names)
+    if len(events) > 2:
+        title += "..."
+    return title
+
+
+@dataclass(frozen=True, slots=True)
+class CountdownEvent:
+    """An event of a config entry, parsed once at setup.
+
+    ``event_date`` is the date of the event itself, or the date the person
+    started working for a retirement. The original DD/MM/YYYY strings are kept
+    only to be exposed unchanged in the sensor attributes.
+    """
+
+    unique_id: str
+    name: str
+    first_name: str
+    event_type: str
+    event_date: date
+    date_str: str
+    death_date: Optional[date] = None
+    death_date_str: Optional[str] = None
+    is_penible: bool = False
+    career_type: str = "normale"
+    retirement_date: Optional[date] = None
+    medal_table: MedalTable = WORK_MEDAL_TABLE
+
+
+def _retirement_date(start_date: date, career_type: str) -> Optional[date]:
+    """Return the estimated retirement date for a work start date."""
+    years_to_retirement = YEARS_TO_RETIREMENT.get(career_type, YEARS_TO_RETIREMENT["normale"])
+    try:
+        return occurrence_in_year(start_date, start_date.year + years_to_retirement)
+    except ValueError as e:
+        _LOGGER.error("Invalid retirement date for start date %s: %s", start_date, e)
+        return None
+
+
+def parse_event(event: Dict[str, Any]) -> Optional[CountdownEvent]:
+    """Validate and parse a raw event of the event store."""
+    if not all(key in event for key in ["name", "type"]):
+        _LOGGER.error("Invalid event configuration, missing required fields: %s", event)
+        return None
+    if event["type"] not in EVENT_TYPES:
+        _LOGGER.error("Invalid event type '%s' for event: %s", event["type"], event)
+        return None
+
+    date_key = "start_date" if event["type"] == "retirement" else "date"
+    if not event.get(date_key):
+        _LOGGER.error("Missing required field '%s' for event: %s", date_key, event)
+        return None
+
+    try:
+        event_date = parse_date(event[date_key])
+    except (ValueError, TypeError, AttributeError) as e:
+        _LOGGER.error("Invalid date format for event %s: %s. Expected DD/MM/YYYY. Skipping event.", event, e)
+        return None
+
+    death_date = None
+    if event.get("death_date"):
+        try:
+            death_date = parse_date(event["death_date"])
+        except (ValueError, TypeError, AttributeError) as e:
+            _LOGGER.error("Invalid death_date format for event %s: %s. Skipping event.", event, e)
+            return None
+
+    is_penible = bool(event.get("is_penible", False))
+    career_type = event.get("career_type", "normale")
+    retirement_date = None
+    if event["type"] == "retirement":
+        retirement_date = _retirement_date(event_date, career_type)
+
+    return CountdownEvent(
+        unique_id=event_unique_id(event),
+        # Les prénoms et noms répétés d'une famille partagent une seule chaîne
+        name=sys.intern(str(event["name"])),
+        first_name=sys.intern(str(event.get("first_name") or "")),
+        event_type=event["type"],
+        event_date=event_date,
+        date_str=event[date_key],
+        death_date=death_date,
+        death_date_str=event.get("death_date") or None,
+        is_penible=is_penible,
+        career_type=career_type,
+        retirement_date=retirement_date,
+        medal_table=WORK_MEDAL_PENIBLE_TABLE if is_penible else WORK_MEDAL_TABLE,
+    )
+
+
+def parse_events(events: Iterable[Dict[str, Any]]) -> List[CountdownEvent]:
+    """Parse the raw events of a config entry, skipping invalid ones."""
+    parsed = []
+    for event in events:
+        countdown_event = parse_event(event)
+        if countdown_event is not None:
+            parsed.append(countdown_event)
+    return parsed
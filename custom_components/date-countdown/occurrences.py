@@ -0,0 +1,167 @@
+"""Yearly occurrence arithmetic for Date Countdown events."""
+import heapq
+from calendar import isleap
+from datetime import date, timedelta
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+from .const import LEAP_DAY_MARCH_1, LEAP_DAY_POLICY
+
+if TYPE_CHECKING:
+    from .model import CountdownEvent
+
+# Une occurrence : (date, événement, années écoulées depuis sa date)
+Occurrence = Tuple[date, "CountdownEvent", int]
+
+_T = TypeVar("_T")
+
+
+def occurrence_in_year(origin: date, year: int, policy: str = LEAP_DAY_POLICY) -> date:
+    """Return the anniversary of ``origin`` in the given year.
+
+    A 29 February origin falls on 28 February or 1 March in common years,
+    depending on the leap-day policy.
+    """
+    if origin.month == 2 and origin.day == 29 and not isleap(year):
+        if policy == LEAP_DAY_MARCH_1:
+            return date(year, 3, 1)
+        return date(year, 2, 28)
+    return origin.replace(year=year)
+
+
+def yearly_rrule(origin: date, policy: str = LEAP_DAY_POLICY) -> str:
+    """Return the RFC 5545 recurrence rule of the anniversaries of ``origin``.
+
+    A plain yearly rule skips 29 February in common years, so leap-day origins
+    recur on the last day of February or on the 60th day of the year, which
+    matches the leap-day policy.
+    """
+    if origin.month == 2 and origin.day == 29:
+        if policy == LEAP_DAY_MARCH_1:
+            return "FREQ=YEARLY;BYYEARDAY=60"
+        return "FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=-1"
+    return "FREQ=YEARLY"
+
+
+def next_occurrence(origin: date, today: date, policy: str = LEAP_DAY_POLICY) -> date:
+    """Return the first anniversary of ``origin`` on or after ``today``."""
+    occurrence = occurrence_in_year(origin, today.year, policy)
+    if occurrence < today:
+        occurrence = occurrence_in_year(origin, today.year + 1, policy)
+    return occurrence
+
+
+def yearly_occurrences(
+    origin: date, start: date, end: date, policy: str = LEAP_DAY_POLICY
+) -> Iterator[Tuple[int, date]]:
+    """Yield ``(years, occurrence)`` for every anniversary within [start, end].
+
+    The first and last matching years are computed directly from the window,
+    so years outside of it are never visited. Occurrences before the origin
+    year are not generated.
+    """
+    first_year = max(start.year, origin.year)
+    if occurrence_in_year(origin, first_year, policy) < start:
+        first_year += 1
+    last_year = end.year
+    if occurrence_in_year(origin, last_year, policy) > end:
+        last_year -= 1
+    for year in range(first_year, last_year + 1):
+        yield year - origin.year, occurrence_in_year(origin, year, policy)
+
+
+def event_occurrences(
+    event: "CountdownEvent", start: date, end: date, policy: str = LEAP_DAY_POLICY
+) -> Iterator["Occurrence"]:
+    """Yield ``(occurrence, event, years)`` of a single event within [start, end] in date order.
+
+    A retirement happens once, on its estimated date.
+    """
+    if event.event_type == "retirement":
+        retirement_date = event.retirement_date
+        if retirement_date is not None and start <= retirement_date <= end:
+            yield retirement_date, event, retirement_date.year - event.event_date.year
+        return
+    for years, occurrence in yearly_occurrences(event.event_date, start, end, policy):
+        yield occurrence, event, years
+
+
+def merge_occurrences(streams: Iterable[Iterator["Occurrence"]]) -> Iterator["Occurrence"]:
+    """Merge streams of occurrences in date order into a single lazy stream.
+
+    Each stream must already be in date order. A heap holds the next
+    occurrence of every stream, so only the occurrences actually consumed are
+    generated and a caller can stop at a limit or a date. Occurrences on the
+    same day keep the order of their streams.
+    """
+    return heapq.merge(*streams, key=itemgetter(0))
+
+
+def iter_occurrences(
+    events: Iterable["CountdownEvent"], start: date, end: date, policy: str = LEAP_DAY_POLICY
+) -> Iterator["Occurrence"]:
+    """Yield the occurrences of many events within [start, end] in date order, lazily."""
+    return merge_occurrences(event_occurrences(event, start, end, policy) for event in events)
+
+
+def tagged_occurrences(
+    events: Iterable["CountdownEvent"], start: date, end: date, tag: _T, policy: str = LEAP_DAY_POLICY
+) -> Iterator[Tuple[date, "CountdownEvent", int, _T]]:
+    """Yield the occurrences of ``iter_occurrences``, each followed by ``tag``.
+
+    Merging the tagged streams of several entries keeps track of the entry of
+    every occurrence: ``merge_occurrences`` only compares the dates.
+    """
+    for day, event, years in iter_occurrences(events, start, end, policy):
+        yield day, event, years, tag
+
+
+class OccurrenceIndex:
+    """Yearly recurrences of many events indexed by month and day.
+
+    A date range is answered by walking the days of the range and looking up
+    the events that recur on each of them, so the cost of a query does not
+    depend on the number of events. Retirements happen once and are indexed
+    by their exact date.
+    """
+
+    def __init__(self, events: Iterable["CountdownEvent"], policy: str = LEAP_DAY_POLICY) -> None:
+        """Index the events."""
+        self._by_month_day: Dict[Tuple[int, int], List["CountdownEvent"]] = {}
+        self._one_off: Dict[date, List["CountdownEvent"]] = {}
+        for event in events:
+            if event.event_type == "retirement":
+                if event.retirement_date is not None:
+                    self._one_off.setdefault(event.retirement_date, []).append(event)
+                continue
+            key = (event.event_date.month, event.event_date.day)
+            self._by_month_day.setdefault(key, []).append(event)
+        self._leap_day_events = self._by_month_day.get((2, 29), [])
+        self._leap_day_fallback = (3, 1) if policy == LEAP_DAY_MARCH_1 else (2, 28)
+
+    def __len__(self) -> int:
+        """Return the number of indexed events."""
+        return sum(len(events) for events in self._by_month_day.values()) + sum(
+            len(events) for events in self._one_off.values()
+        )
+
+    def query(self, start: date, end: date) -> Iterator[Occurrence]:
+        """Yield ``(occurrence, event, years)`` within [start, end] in date order."""
+        one_day = timedelta(days=1)
+        day = start
+        while day <= end:
+            key = (day.month, day.day)
+            for event in self._by_month_day.get(key, ()):
+                years = day.year - event.event_date.year
+                if years >= 0:
+                    yield day, event, years
+            if self._leap_day_events and key == self._leap_day_fallback and not isleap(day.year):
+                for event in self._leap_day_events:
+                    years = day.year - event.event_date.year
+                    if years >= 0:
+                        yield day, event, years
+            for event in self._one_off.get(day, ()):
+                yield day, event, day.year - event.event_date.year
+            if day == date.max:
+                break
+            day += one_day
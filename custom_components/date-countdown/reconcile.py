@@ -0,0 +1,69 @@
+"""Incremental reconciliation of the entities of a config entry."""
+import logging
+from typing import Callable, Dict, List
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .const import SIGNAL_EVENTS_UPDATED
+from .model import CountdownEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_reconciliation(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    entities: Dict[str, Entity],
+    factory: Callable[[CountdownEvent], Entity],
+    async_add_entities: Callable[[List[Entity]], None],
+) -> None:
+    """Keep the per-event entities of a platform in sync with the entry events.
+
+    ``entities`` maps the unique_id of each event to its entity, which must
+    provide ``async_set_event``. Entities of removed events are removed from
+    the entity registry, new events get new entities and modified events are
+    updated in place.
+    """
+
+    @callback
+    def _async_reconcile(
+        added: List[CountdownEvent], removed: List[str], updated: List[CountdownEvent]
+    ) -> None:
+        registry = er.async_get(hass)
+        for unique_id in removed:
+            entity = entities.pop(unique_id, None)
+            if entity is None:
+                continue
+            if entity.entity_id and registry.async_get(entity.entity_id) is not None:
+                registry.async_remove(entity.entity_id)
+            else:
+                hass.async_create_task(entity.async_remove())
+
+        for event in updated:
+            entity = entities.get(event.unique_id)
+            if entity is not None:
+                entity.async_set_event(event)
+
+        new_entities = []
+        for event in added:
+            if event.unique_id in entities:
+                continue
+            entity = factory(event)
+            entities[event.unique_id] = entity
+            new_entities.append(entity)
+        if new_entities:
+            async_add_entities(new_entities)
+
+        _LOGGER.debug(
+            "Reconciled entities of entry %s: %d added, %d removed, %d updated",
+            entry.entry_id, len(new_entities), len(removed), len(updated),
+        )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_EVENTS_UPDATED.format(entry.entry_id), _async_reconcile)
+    )
@@ -0,0 +1,146 @@
+"""Services for Date Countdown."""
+import heapq
+import logging
+from datetime import timedelta
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Tuple
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, EVENT_TYPES, SERVICE_GET_UPCOMING, SERVICE_IMPORT_EVENTS
+from .coordinator import DateCountdownCoordinator, get_coordinators
+from .importer import IMPORT_FORMATS, async_import_events
+from .occurrences import merge_occurrences, tagged_occurrences
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_LIMIT = "limit"
+ATTR_TYPES = "types"
+ATTR_DAYS = "days"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_PATH = "path"
+ATTR_FORMAT = "format"
+
+GET_UPCOMING_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_LIMIT, default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+    vol.Optional(ATTR_TYPES): vol.All(cv.ensure_list, [vol.In(EVENT_TYPES)]),
+    vol.Optional(ATTR_DAYS): vol.All(vol.Coerce(int), vol.Range(min=0, max=36525)),
+})
+
+IMPORT_EVENTS_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTRY_ID): cv.string,
+    vol.Required(ATTR_PATH): cv.string,
+    vol.Optional(ATTR_FORMAT): vol.In(IMPORT_FORMATS),
+})
+
+
+def _iter_entry_upcoming(
+    coordinator: DateCountdownCoordinator, index: int, event_types: List[str]
+) -> Iterator[Tuple[int, int, str]]:
+    """Tag the upcoming occurrences of an entry with the index of its coordinator."""
+    for days, unique_id in coordinator.iter_upcoming(event_types):
+        yield days, index, unique_id
+
+
+def _get_occurrences(
+    coordinators: List[DateCountdownCoordinator], event_types: List[str], days: int, limit: int
+) -> List[Dict[str, Any]]:
+    """Return every occurrence of the next ``days`` days, up to ``limit``, across entries.
+
+    The occurrences of all events are merged lazily, so only the first
+    ``limit`` ones are generated, whatever the number of events.
+    """
+    today = dt_util.now().date()
+    end = today + timedelta(days=days)
+    merged = merge_occurrences(
+        tagged_occurrences(
+            (event for event in coordinator.events if event.event_type in event_types), today, end, index
+        )
+        for index, coordinator in enumerate(coordinators)
+    )
+    return [
+        {
+            "entry_id": coordinators[index].entry.entry_id,
+            "unique_id": event.unique_id,
+            "name": event.name,
+            "first_name": event.first_name,
+            "type": event.event_type,
+            "date": day.isoformat(),
+            "days": (day - today).days,
+            "years": years,
+        }
+        for day, event, years, index in islice(merged, limit)
+    ]
+
+
+async def _async_get_upcoming(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the next occurrences across all config entries."""
+    limit = call.data[ATTR_LIMIT]
+    event_types = call.data.get(ATTR_TYPES) or EVENT_TYPES
+    coordinators = get_coordinators(hass)
+    if ATTR_DAYS in call.data:
+        return {"events": _get_occurrences(coordinators, event_types, call.data[ATTR_DAYS], limit)}
+
+    merged = heapq.merge(*(
+        _iter_entry_upcoming(coordinator, index, event_types)
+        for index, coordinator in enumerate(coordinators)
+    ))
+    events: List[Dict[str, Any]] = []
+    for days, index, unique_id in islice(merged, limit):
+        coordinator = coordinators[index]
+        event = coordinator.events_by_id[unique_id]
+        state = coordinator.data[unique_id]
+        events.append({
+            "entry_id": coordinator.entry.entry_id,
+            "unique_id": unique_id,
+            "name": event.name,
+            "first_name": event.first_name,
+            "type": event.event_type,
+            "date": state["next_date"].isoformat(),
+            "days": days,
+            "years": state["years"],
+        })
+    return {"events": events}
+
+
+async def _async_import_events(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Import the events of a file into a config entry and log the rejected rows."""
+    entry = hass.config_entries.async_get_entry(call.data[ATTR_ENTRY_ID])
+    if entry is None or entry.domain != DOMAIN:
+        raise HomeAssistantError(f"Unknown Date Countdown entry: {call.data[ATTR_ENTRY_ID]}")
+    report = await async_import_events(hass, entry, call.data[ATTR_PATH], call.data.get(ATTR_FORMAT))
+    # Un service admin ne retourne pas de réponse : les lignes rejetées vont dans le journal
+    for error in report["errors"]:
+        _LOGGER.warning("Import of %s: row %s rejected: %s", call.data[ATTR_PATH], error["row"], error["errors"])
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Date Countdown services."""
+
+    async def _handle_get_upcoming(call: ServiceCall) -> ServiceResponse:
+        return await _async_get_upcoming(hass, call)
+
+    async def _handle_import_events(call: ServiceCall) -> None:
+        await _async_import_events(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_UPCOMING,
+        _handle_get_upcoming,
+        schema=GET_UPCOMING_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    # L'import écrase les événements enregistrés : réservé aux administrateurs
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_IMPORT_EVENTS,
+        _handle_import_events,
+        schema=IMPORT_EVENTS_SCHEMA,
+    )
@@ -0,0 +1,100 @@
+"""Performance counters of a Date Countdown config entry."""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+def _ratio(part: int, total: int) -> Optional[float]:
+    """Return a ratio rounded for display, or None without any sample."""
+    return round(part / total, 3) if total else None
+
+
+@dataclass(slots=True)
+class EntryStats:
+    """Counters updated by the coordinator and the calendars of an entry.
+
+    Durations are in seconds. Recording a sample only adds to the counters,
+    so the hot paths stay cheap; ratios and averages are derived on read.
+    """
+
+    setup_duration: Optional[float] = None
+    refresh_count: int = 0
+    refresh_time: float = 0.0
+    last_refresh_duration: Optional[float] = None
+    offloaded_refresh_count: int = 0
+    last_refresh_shards: int = 0
+    listeners_time: float = 0.0
+    last_listeners_duration: Optional[float] = None
+    get_events_calls: int = 0
+    get_events_time: float = 0.0
+    get_events_window_days: int = 0
+    get_events_max_window_days: int = 0
+    occurrences: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    summary_cache_hits: int = 0
+    summary_cache_misses: int = 0
+
+    def record_refresh(self, duration: float, shards: int = 0) -> None:
+        """Record the computation of the states of all events, in ``shards`` executor jobs if offloaded."""
+        self.refresh_count += 1
+        self.refresh_time += duration
+        self.last_refresh_duration = duration
+        self.last_refresh_shards = shards
+        if shards:
+            self.offloaded_refresh_count += 1
+
+    def record_listeners(self, duration: float) -> None:
+        """Record the push of new data to all the listeners of the coordinator, sensors and calendars."""
+        self.listeners_time += duration
+        self.last_listeners_duration = duration
+
+    def record_get_events(self, window_days: int, occurrences: int, cached: bool, duration: float) -> None:
+        """Record a calendar query."""
+        self.get_events_calls += 1
+        self.get_events_time += duration
+        self.get_events_window_days += window_days
+        self.get_events_max_window_days = max(self.get_events_max_window_days, window_days)
+        self.occurrences += occurrences
+        if cached:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def record_summary(self, cached: bool) -> None:
+        """Record a lookup in the summary cache shared by the calendars."""
+        if cached:
+            self.summary_cache_hits += 1
+        else:
+            self.summary_cache_misses += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters with their derived values, durations in milliseconds."""
+
+        def _ms(seconds: Optional[float]) -> Optional[float]:
+            return None if seconds is None else round(seconds * 1000, 3)
+
+        return {
+            "setup_duration_ms": _ms(self.setup_duration),
+            "refresh_count": self.refresh_count,
+            "refresh_time_ms": _ms(self.refresh_time),
+            "last_refresh_duration_ms": _ms(self.last_refresh_duration),
+            "offloaded_refresh_count": self.offloaded_refresh_count,
+            "last_refresh_shards": self.last_refresh_shards,
+            "listeners_time_ms": _ms(self.listeners_time),
+            "last_listeners_duration_ms": _ms(self.last_listeners_duration),
+            "get_events_calls": self.get_events_calls,
+            "get_events_time_ms": _ms(self.get_events_time),
+            "get_events_average_window_days": (
+                round(self.get_events_window_days / self.get_events_calls, 1) if self.get_events_calls else None
+            ),
+            "get_events_max_window_days": self.get_events_max_window_days,
+            "occurrences_generated": self.occurrences,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": _ratio(self.cache_hits, self.cache_hits + self.cache_misses),
+            "summary_cache_hits": self.summary_cache_hits,
+            "summary_cache_misses": self.summary_cache_misses,
+            "summary_cache_hit_rate": _ratio(
+                self.summary_cache_hits, self.summary_cache_hits + self.summary_cache_misses
+            ),
+        }
@@ -0,0 +1,92 @@
+"""Persistent storage of the events of Date Countdown config entries."""
+import logging
+from typing import Any, Dict, Iterable, List
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_STORES, DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+from .model import generate_entry_title
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EventStore:
+    """Raw events of a config entry, kept in ``.storage/date_countdown.<entry_id>``.
+
+    Edits are saved with a delay, so several changes in a row are written
+    once and the global config entries file is never rewritten for an event.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store of an entry."""
+        self._store: Store[Dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._entry_id = entry_id
+        self._loaded = False
+        self.events: List[Dict[str, Any]] = []
+
+    async def async_load(self, entry: ConfigEntry) -> None:
+        """Load the events, migrating them from the entry options on first use."""
+        if self._loaded:
+            return
+        data = await self._store.async_load()
+        if data is None:
+            # Migration : les événements étaient stockés dans les options de l'entrée
+            self.events = list(entry.options.get("events", []))
+            await self._store.async_save(self._data_to_save())
+            _LOGGER.info("Migrated %d event(s) of entry %s to storage", len(self.events), self._entry_id)
+        else:
+            self.events = data.get("events", [])
+        self._loaded = True
+
+    @callback
+    def async_set_events(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Replace the events and schedule a delayed save."""
+        self.events = list(events)
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the stored events."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to write to disk."""
+        return {"events": self.events}
+
+
+async def async_get_event_store(hass: HomeAssistant, entry: ConfigEntry) -> EventStore:
+    """Return the loaded event store of an entry.
+
+    Stores outlive the entry reloads so that a pending delayed save is never
+    read back from an outdated file.
+    """
+    stores: Dict[str, EventStore] = hass.data.setdefault(DATA_STORES, {})
+    store = stores.get(entry.entry_id)
+    if store is None:
+        store = stores[entry.entry_id] = EventStore(hass, entry.entry_id)
+    await store.async_load(entry)
+    return store
+
+
+async def async_commit_events(hass: HomeAssistant, entry: ConfigEntry, events: Iterable[Dict[str, Any]]) -> None:
+    """Save the events of an entry and apply them to its loaded entities.
+
+    The store is written once, after a delay, and the entry itself is only
+    updated when its title changes.
+    """
+    store = await async_get_event_store(hass, entry)
+    store.async_set_events(events)
+    title = generate_entry_title(store.events)
+    if entry.title != title:
+        hass.config_entries.async_update_entry(entry, title=title)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is not None:
+        entry_data["coordinator"].async_update_events(store.events)
+
+
+async def async_remove_event_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the stored events of a removed entry."""
+    store = hass.data.get(DATA_STORES, {}).pop(entry_id, None) or EventStore(hass, entry_id)
+    await store.async_remove()